@@ -1,8 +1,10 @@
+import importlib.util
 import os
 import sys
 
-# Add the parent directory to the Python path so we can import from src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Add the parent directory to the Python path unless mwareeth is already installed
+if importlib.util.find_spec("mwareeth") is None:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from mwareeth.family_tree_builder import FamilyTreeBuilder
 
@@ -18,6 +20,6 @@ if __name__ == "__main__":
 
     import json
 
-    # Save the family tree to a JSON file
-    with open("family_tree.json", "w") as f:
-        json.dump(builder.to_dict(), f, indent=2)
+    # Save the family tree to a compact JSON file through a 64 KiB buffer
+    with open("family_tree.json", "w", buffering=65536) as f:
+        json.dump(builder.to_dict(), f, separators=(",", ":"))
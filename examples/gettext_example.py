@@ -4,15 +4,37 @@ This example demonstrates how to use the gettext-based internationalization (i18
 support in the mwareeth project.
 """
 
+import importlib.util
 import os
 import sys
+from types import SimpleNamespace
 
-# Add the parent directory to the path so we can import the mwareeth package
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Add the parent directory to the Python path unless mwareeth is already installed
+if importlib.util.find_spec("mwareeth") is None:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from mwareeth.family_tree_builder import FamilyTreeBuilder
 from mwareeth.i18n import _, get_available_languages, set_language
 
+# Message IDs printed in the translation examples
+MESSAGE_KEYS = ("welcome", "deceased_intro", "name", "gender", "father", "mother")
+
+
+def preload(keys):
+    """
+    Translate each message ID once for the current language.
+
+    Call this again after every `set_language` so the returned strings match
+    the active language.
+
+    Args:
+        keys: The message IDs to translate
+
+    Returns:
+        A namespace mapping each message ID to its translated string
+    """
+    return SimpleNamespace(**{key: _(key) for key in keys})
+
 
 def print_separator():
     """Print a separator line."""
@@ -33,28 +55,30 @@ def main():
     # Example 1: Using English translations
     print("Example 1: Using English translations")
     set_language("en")
+    messages = preload(MESSAGE_KEYS)
 
     # Print some translated strings
-    print(_("welcome"))
-    print(_("deceased_intro"))
-    print(_("name"), ":", "John")
-    print(_("gender"), ":", "male")
-    print(_("father"), ":", "Michael")
-    print(_("mother"), ":", "Sarah")
+    print(messages.welcome)
+    print(messages.deceased_intro)
+    print(messages.name, ":", "John")
+    print(messages.gender, ":", "male")
+    print(messages.father, ":", "Michael")
+    print(messages.mother, ":", "Sarah")
 
     print_separator()
 
     # Example 2: Using Arabic translations
     print("Example 2: Using Arabic translations")
     set_language("ar")
+    messages = preload(MESSAGE_KEYS)
 
     # Print the same strings in Arabic
-    print(_("welcome"))
-    print(_("deceased_intro"))
-    print(_("name"), ":", "جون")
-    print(_("gender"), ":", "ذكر")
-    print(_("father"), ":", "مايكل")
-    print(_("mother"), ":", "سارة")
+    print(messages.welcome)
+    print(messages.deceased_intro)
+    print(messages.name, ":", "جون")
+    print(messages.gender, ":", "ذكر")
+    print(messages.father, ":", "مايكل")
+    print(messages.mother, ":", "سارة")
 
     print_separator()
 
@@ -69,27 +93,27 @@ def main():
     builder_en = FamilyTreeBuilder(language="en")
 
     # Add some people
-    builder_en.add_person(
-        name="John",
-        gender="male",
-        birth_year=1950,
-        death_year=2020,
-        is_deceased=True,
-    )
-    builder_en.add_person(
-        name="Mary",
-        gender="female",
-        birth_year=1952,
-    )
-    builder_en.add_person(
-        name="Bob",
-        gender="male",
-        birth_year=1975,
+    builder_en.add_people(
+        [
+            {
+                "name": "John",
+                "gender": "male",
+                "birth_year": 1950,
+                "death_year": 2020,
+                "is_deceased": True,
+            },
+            {"name": "Mary", "gender": "female", "birth_year": 1952},
+            {"name": "Bob", "gender": "male", "birth_year": 1975},
+        ]
     )
 
     # Add relationships
-    builder_en.add_relationship("Bob", "father", "John")
-    builder_en.add_relationship("Bob", "mother", "Mary")
+    builder_en.add_relationships(
+        [
+            ("Bob", "father", "John"),
+            ("Bob", "mother", "Mary"),
+        ]
+    )
 
     # Build the family tree
     family_tree_en = builder_en.build()
@@ -105,29 +129,32 @@ def main():
 
     # Create a family tree builder
     builder_ar = FamilyTreeBuilder(language="ar")
+    # The English builder above switched the language back, so translate the
+    # relation names again now that Arabic is active
+    messages = preload(MESSAGE_KEYS)
 
     # Add some people
-    builder_ar.add_person(
-        name="جون",
-        gender="male",
-        birth_year=1950,
-        death_year=2020,
-        is_deceased=True,
-    )
-    builder_ar.add_person(
-        name="ماري",
-        gender="female",
-        birth_year=1952,
-    )
-    builder_ar.add_person(
-        name="بوب",
-        gender="male",
-        birth_year=1975,
+    builder_ar.add_people(
+        [
+            {
+                "name": "جون",
+                "gender": "male",
+                "birth_year": 1950,
+                "death_year": 2020,
+                "is_deceased": True,
+            },
+            {"name": "ماري", "gender": "female", "birth_year": 1952},
+            {"name": "بوب", "gender": "male", "birth_year": 1975},
+        ]
     )
 
     # Add relationships
-    builder_ar.add_relationship("بوب", _("father"), "جون")
-    builder_ar.add_relationship("بوب", _("mother"), "ماري")
+    builder_ar.add_relationships(
+        [
+            ("بوب", messages.father, "جون"),
+            ("بوب", messages.mother, "ماري"),
+        ]
+    )
 
     # Build the family tree
     family_tree_ar = builder_ar.build()
@@ -5,11 +5,13 @@ Example script demonstrating how to use the Mwareeth GUI.
 This script shows how to launch the GUI version of the Mwareeth inheritance calculator.
 """
 
+import importlib.util
 import os
 import sys
 
-# Add the parent directory to the Python path so we can import from src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Add the parent directory to the Python path unless mwareeth is already installed
+if importlib.util.find_spec("mwareeth") is None:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 try:
     # Try to import the GUI module
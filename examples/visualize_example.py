@@ -2,11 +2,13 @@
 Example script demonstrating how to visualize a family tree.
 """
 
+import importlib.util
 import os
 import sys
 
-# Add the parent directory to the Python path so we can import from src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Add the parent directory to the Python path unless mwareeth is already installed
+if importlib.util.find_spec("mwareeth") is None:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from mwareeth.entities.family_tree import FamilyTree
 from mwareeth.entities.person import Gender, Person
@@ -1,17 +1,57 @@
-import argparse
 import importlib.util
 import os
 import platform
 import subprocess
 import sys
+from types import SimpleNamespace
 
-from mwareeth.family_tree_builder import FamilyTreeBuilder
+from mwareeth import __version__
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+GUI_EXAMPLE_PATH = os.path.join(ROOT_DIR, "examples", "gui_example.py")
+RUN_GUI_SCRIPT_PATH = os.path.join(ROOT_DIR, "scripts", "run_gui.sh")
+IS_MACOS = platform.system() == "Darwin"
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mwareeth")
+TCL_TK_CACHE_FILE = os.path.join(CACHE_DIR, "tcltk_path")
+
+
+def _install_sentinel_path(package_name, extras=None):
+    """
+    Get the path of the file marking a package as installed for this mwareeth version.
+
+    Args:
+        package_name (str): The name of the package.
+        extras (str, optional): Any extras installed with the package.
+
+    Returns:
+        str: The path of the sentinel file.
+    """
+    requirement = f"{package_name}[{extras}]" if extras else package_name
+    return os.path.join(CACHE_DIR, f"{requirement}.installed.v{__version__}")
+
+
+def _touch(path):
+    """
+    Create an empty file, ignoring errors since it only serves as a cache.
+
+    Args:
+        path (str): The path of the file to create.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a"):
+            pass
+    except OSError:
+        pass
 
 
 def check_and_install_package(package_name, extras=None):
     """
     Check if a package is installed and install it if it's not.
 
+    A sentinel file is written once the package is known to be installed, so
+    later runs only need to check that the file exists.
+
     Args:
         package_name (str): The name of the package to check and install.
         extras (str, optional): Any extras to install with the package.
@@ -19,30 +59,135 @@ def check_and_install_package(package_name, extras=None):
     Returns:
         bool: True if the package is installed or was successfully installed, False otherwise.
     """
+    sentinel = _install_sentinel_path(package_name, extras)
+    if os.path.exists(sentinel):
+        return True
+
+    # Locate the package without importing it
+    if importlib.util.find_spec(package_name) is not None:
+        _touch(sentinel)
+        return True
+
+    # If the package is not installed, try to install it
     try:
-        # Try to import the package
-        importlib.import_module(package_name)
+        print(f"Installing {package_name}...")
+        if extras:
+            cmd = [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                f"{package_name}[{extras}]",
+            ]
+        else:
+            cmd = [sys.executable, "-m", "pip", "install", package_name]
+
+        subprocess.run(cmd, check=True)
+        _touch(sentinel)
         return True
-    except ImportError:
-        # If the package is not installed, try to install it
+    except subprocess.SubprocessError:
+        print(f"Error: Could not install {package_name}.")
+        return False
+
+
+def _read_cached_tcl_tk_path():
+    """
+    Read the Tcl/Tk installation path cached by a previous run.
+
+    Returns:
+        str: The cached path, or None if there is no cache or the path no longer exists.
+    """
+    try:
+        with open(TCL_TK_CACHE_FILE) as f:
+            tcl_tk_path = f.read().strip()
+    except OSError:
+        return None
+    return tcl_tk_path if os.path.isdir(tcl_tk_path) else None
+
+
+def _write_cached_tcl_tk_path(tcl_tk_path):
+    """
+    Cache the Tcl/Tk installation path so later runs can skip Homebrew.
+
+    Args:
+        tcl_tk_path (str): The Tcl/Tk installation path.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(TCL_TK_CACHE_FILE, "w") as f:
+            f.write(tcl_tk_path)
+    except OSError:
+        pass
+
+
+def _brew_prefix_tcl_tk():
+    """
+    Ask Homebrew for the Tcl/Tk installation path.
+
+    Returns:
+        subprocess.CompletedProcess: The result of `brew --prefix --installed tcl-tk`,
+        which exits with a nonzero code if Tcl/Tk is not installed.
+
+    Raises:
+        FileNotFoundError: If Homebrew is not installed.
+    """
+    return subprocess.run(
+        ["brew", "--prefix", "--installed", "tcl-tk"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+
+
+def _find_tcl_tk_path():
+    """
+    Find the Tcl/Tk installation path with Homebrew, installing Tcl/Tk if needed.
+
+    A single `brew --prefix` call tells whether Homebrew and Tcl/Tk are installed
+    and where Tcl/Tk lives.
+
+    Returns:
+        str: The Tcl/Tk installation path, or None if it could not be found.
+    """
+    try:
+        result = _brew_prefix_tcl_tk()
+    except FileNotFoundError:
+        print("Homebrew is not installed. Attempting to install...")
+        install_cmd = '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
+        print(f"Running: {install_cmd}")
+        print("This may take a while and might require your password.")
+        print("If this fails, please install Homebrew manually and try again.")
+        print("Visit https://brew.sh for installation instructions.")
+
+        # We can't directly install Homebrew here as it requires user interaction
+        # Just provide instructions
+        print("\nPlease install Homebrew manually and run this script again.")
+        print("After installing Homebrew, you may need to run:")
+        print("  brew install tcl-tk")
+        return None
+    except subprocess.SubprocessError:
+        print("Could not check if Tcl/Tk is installed.")
+        return None
+
+    if result.returncode != 0:
+        print("Tcl/Tk is not installed with Homebrew. Attempting to install...")
         try:
-            print(f"Installing {package_name}...")
-            if extras:
-                cmd = [
-                    sys.executable,
-                    "-m",
-                    "pip",
-                    "install",
-                    f"{package_name}[{extras}]",
-                ]
-            else:
-                cmd = [sys.executable, "-m", "pip", "install", package_name]
+            subprocess.run(["brew", "install", "tcl-tk"], check=True)
+            print("Successfully installed Tcl/Tk.")
+            result = _brew_prefix_tcl_tk()
+        except subprocess.SubprocessError as e:
+            print(f"Error installing Tcl/Tk: {e}")
+            print("Please install Tcl/Tk manually with:")
+            print("  brew install tcl-tk")
+            return None
 
-            subprocess.run(cmd, check=True)
-            return True
-        except subprocess.SubprocessError:
-            print(f"Error: Could not install {package_name}.")
-            return False
+        if result.returncode != 0:
+            print("Could not get Tcl/Tk installation path.")
+            return None
+
+    tcl_tk_path = result.stdout.strip()
+    print(f"Found Tcl/Tk at: {tcl_tk_path}")
+    return tcl_tk_path
 
 
 def setup_macos_tkinter():
@@ -52,86 +197,37 @@ def setup_macos_tkinter():
     This function checks if the system is macOS and if Homebrew and Tcl/Tk are available.
     If they are, it sets up the environment variables needed for Tkinter to work.
     If Homebrew or Tcl/Tk are not installed, it attempts to install them.
+    The Tcl/Tk path is cached on disk so later runs do not need to call Homebrew.
 
     Returns:
         bool: True if the setup was successful, False otherwise.
     """
     # Check if the system is macOS
-    if platform.system() != "Darwin":
+    if not IS_MACOS:
         return True
 
     print("Setting up Tkinter for macOS...")
 
-    # Check if Homebrew is installed
-    try:
-        subprocess.run(
-            ["brew", "--version"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True,
-        )
-        print("Homebrew is installed.")
-    except (subprocess.SubprocessError, FileNotFoundError):
-        print("Homebrew is not installed. Attempting to install...")
-        try:
-            install_cmd = '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
-            print(f"Running: {install_cmd}")
-            print("This may take a while and might require your password.")
-            print("If this fails, please install Homebrew manually and try again.")
-            print("Visit https://brew.sh for installation instructions.")
-
-            # We can't directly install Homebrew here as it requires user interaction
-            # Just provide instructions
-            print("\nPlease install Homebrew manually and run this script again.")
-            print("After installing Homebrew, you may need to run:")
-            print("  brew install tcl-tk")
-            return False
-        except Exception as e:
-            print(f"Error attempting to install Homebrew: {e}")
-            return False
-
-    # Check if Tcl/Tk is installed
-    try:
-        result = subprocess.run(
-            ["brew", "list", "tcl-tk"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        if result.returncode != 0:
-            print("Tcl/Tk is not installed with Homebrew. Attempting to install...")
-            try:
-                subprocess.run(["brew", "install", "tcl-tk"], check=True)
-                print("Successfully installed Tcl/Tk.")
-            except subprocess.SubprocessError as e:
-                print(f"Error installing Tcl/Tk: {e}")
-                print("Please install Tcl/Tk manually with:")
-                print("  brew install tcl-tk")
-                return False
-        else:
-            print("Tcl/Tk is installed.")
-    except subprocess.SubprocessError:
-        print("Could not check if Tcl/Tk is installed.")
-        return False
-
-    # Get the Tcl/Tk installation path
-    try:
-        result = subprocess.run(
-            ["brew", "--prefix", "tcl-tk"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True,
-        )
-        tcl_tk_path = result.stdout.decode("utf-8").strip()
+    tcl_tk_path = _read_cached_tcl_tk_path()
+    if tcl_tk_path:
         print(f"Found Tcl/Tk at: {tcl_tk_path}")
-    except subprocess.SubprocessError:
-        print("Could not get Tcl/Tk installation path.")
-        return False
+    else:
+        tcl_tk_path = _find_tcl_tk_path()
+        if not tcl_tk_path:
+            return False
+        _write_cached_tcl_tk_path(tcl_tk_path)
 
     # Set up environment variables
-    os.environ["PATH"] = f"{tcl_tk_path}/bin:{os.environ.get('PATH', '')}"
-    os.environ["LDFLAGS"] = f"-L{tcl_tk_path}/lib"
-    os.environ["CPPFLAGS"] = f"-I{tcl_tk_path}/include"
-    os.environ["PKG_CONFIG_PATH"] = f"{tcl_tk_path}/lib/pkgconfig"
-    os.environ["PYTHON_CONFIGURE_OPTS"] = (
-        f"--with-tcltk-includes='-I{tcl_tk_path}/include' --with-tcltk-libs='-L{tcl_tk_path}/lib -ltcl8.6 -ltk8.6'"
+    os.environ.update(
+        {
+            "PATH": f"{tcl_tk_path}/bin:{os.environ.get('PATH', '')}",
+            "LDFLAGS": f"-L{tcl_tk_path}/lib",
+            "CPPFLAGS": f"-I{tcl_tk_path}/include",
+            "PKG_CONFIG_PATH": f"{tcl_tk_path}/lib/pkgconfig",
+            "PYTHON_CONFIGURE_OPTS": (
+                f"--with-tcltk-includes='-I{tcl_tk_path}/include' --with-tcltk-libs='-L{tcl_tk_path}/lib -ltcl8.6 -ltk8.6'"
+            ),
+        }
     )
 
     print("Environment variables set up for Tcl/Tk.")
@@ -145,29 +241,27 @@ def run_gui_example():
     Returns:
         bool: True if the example script ran successfully, False otherwise.
     """
-    example_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "examples", "gui_example.py"
-    )
-    if os.path.exists(example_path):
+    if os.path.exists(GUI_EXAMPLE_PATH):
         try:
             print("Trying to run the GUI example script...")
-            subprocess.run([sys.executable, example_path], check=True)
+            subprocess.run([sys.executable, GUI_EXAMPLE_PATH], check=True)
             return True
         except subprocess.SubprocessError:
             print("Failed to run the GUI example script.")
             return False
     else:
-        print(f"Could not find the GUI example script at {example_path}")
+        print(f"Could not find the GUI example script at {GUI_EXAMPLE_PATH}")
         return False
 
 
-def main():
+def _parse_args_with_argparse(argv):
     """
-    Main entry point for the mwareeth application.
+    Parse command-line arguments with argparse.
 
-    This function parses command-line arguments and launches either the CLI or GUI version
-    of the application, depending on the arguments provided.
+    Only used for help output and invalid arguments, so argparse is imported lazily.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Mwareeth - Islamic Inheritance Calculator"
     )
@@ -175,7 +269,48 @@ def main():
     parser.add_argument(
         "--language", "-l", default="en", help="Language code (default: en)"
     )
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def parse_args(argv):
+    """
+    Parse the command-line arguments.
+
+    The two supported flags are scanned by hand to avoid importing argparse on
+    every launch. Help requests and unexpected arguments are handed over to
+    argparse, which prints the usage and exits as usual.
+
+    Args:
+        argv (list): The command-line arguments, without the program name.
+
+    Returns:
+        SimpleNamespace: An object with `gui` and `language` attributes.
+    """
+    gui = False
+    language = "en"
+    args = iter(argv)
+    for arg in args:
+        if arg == "--gui":
+            gui = True
+        elif arg in ("--language", "-l"):
+            language = next(args, None)
+            if language is None or language.startswith("-"):
+                return _parse_args_with_argparse(argv)
+        elif arg.startswith("--language="):
+            language = arg.partition("=")[2]
+        else:
+            return _parse_args_with_argparse(argv)
+    return SimpleNamespace(gui=gui, language=language)
+
+
+def main():
+    """
+    Main entry point for the mwareeth application.
+
+    This function parses command-line arguments and launches either the CLI or GUI version
+    of the application, depending on the arguments provided.
+    """
+    args = parse_args(sys.argv[1:])
 
     if args.gui:
         # Check and install GUI dependencies if needed
@@ -189,11 +324,8 @@ def main():
         if not setup_macos_tkinter():
             print("Failed to set up Tkinter environment for macOS.")
             print("You can try running the GUI with the run_gui.sh script:")
-            script_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "scripts", "run_gui.sh"
-            )
-            if os.path.exists(script_path):
-                print(f"  {script_path}")
+            if os.path.exists(RUN_GUI_SCRIPT_PATH):
+                print(f"  {RUN_GUI_SCRIPT_PATH}")
             else:
                 print("  scripts/run_gui.sh")
             sys.exit(1)
@@ -217,14 +349,11 @@ def main():
         except Exception as e:
             print(f"Error starting GUI: {e}")
 
-            if platform.system() == "Darwin" and "tcl" in str(e).lower():
+            if IS_MACOS and "tcl" in str(e).lower():
                 print("Tkinter could not initialize properly on macOS.")
                 print("You can try running the GUI with the run_gui.sh script:")
-                script_path = os.path.join(
-                    os.path.dirname(os.path.abspath(__file__)), "scripts", "run_gui.sh"
-                )
-                if os.path.exists(script_path):
-                    print(f"  {script_path}")
+                if os.path.exists(RUN_GUI_SCRIPT_PATH):
+                    print(f"  {RUN_GUI_SCRIPT_PATH}")
                 else:
                     print("  scripts/run_gui.sh")
 
@@ -233,6 +362,8 @@ def main():
                 sys.exit(1)
     else:
         # Launch the CLI version
+        from mwareeth.family_tree_builder import FamilyTreeBuilder
+
         builder = FamilyTreeBuilder(language=args.language)
         tree = builder.interactive_build()
         print(tree.visualize())
@@ -0,0 +1,17 @@
+"""
+This module provides the enum base classes shared by the entities.
+"""
+
+from enum import Enum
+
+
+class IdentityHashEnum(Enum):
+    """
+    Enum whose members hash by identity.
+
+    Enum members are singletons compared by identity, so hashing them by identity is
+    consistent with their equality. It also avoids Enum.__hash__, which is written in
+    Python and hashes the member name, on every dict or set lookup keyed by a member.
+    """
+
+    __hash__ = object.__hash__
@@ -4,21 +4,28 @@ and support Islamic inheritance calculations.
 """
 
 import itertools
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, List, Optional, Set
+from enum import Enum, IntEnum
+from typing import Deque, Dict, FrozenSet, List, Optional, Tuple
 
 from ..heir_builder import create_heir_from_relationship
+from ..i18n import get_language
 
 # Import the translator if available, otherwise use a simple translation function
 from .heir import Heir
 from .madhhab import Madhhab
 from .person import Gender, Person
-from .relationship import Relationship, RelationshipType
+from .relationship import (
+    ANCESTOR_RELATIONSHIPS,
+    SIBLING_RELATIONSHIPS,
+    UNCLE_AND_AUNT_RELATIONSHIPS,
+    Relationship,
+    RelationshipType,
+)
 
 
-class LineageType(Enum):
+class LineageType(IntEnum):
     """The type of lineage."""
 
     FULL = 1
@@ -42,6 +49,99 @@ class RelationshipConfig:
     lineage_operation: LineageOperation
 
 
+# Relationship pushed onto the lineage when moving from a person to their child
+CHILD_LINEAGE_RELATIONSHIP: Dict[Gender, RelationshipType] = {
+    Gender.MALE: RelationshipType.SON,
+    Gender.FEMALE: RelationshipType.DAUGHTER,
+    Gender.UNKNOWN: RelationshipType.DAUGHTER,
+}
+
+# Relationship types whose children are related to the deceased, mapped to the
+# relationship types given to their (male, other) children
+_CHILDREN_RELATIONSHIP_TYPES = {
+    RelationshipType.SELF: (RelationshipType.SON, RelationshipType.DAUGHTER),
+    # Descendants
+    RelationshipType.SON: (RelationshipType.GRANDSON, RelationshipType.GRANDDAUGHTER),
+    RelationshipType.DAUGHTER: (
+        RelationshipType.GRANDSON,
+        RelationshipType.GRANDDAUGHTER,
+    ),
+    RelationshipType.GRANDSON: (
+        RelationshipType.GRANDSON,
+        RelationshipType.GRANDDAUGHTER,
+    ),
+    RelationshipType.GRANDDAUGHTER: (
+        RelationshipType.GRANDSON,
+        RelationshipType.GRANDDAUGHTER,
+    ),
+    # Siblings, nephews and nieces
+    **{
+        relationship_type: (RelationshipType.NEPHEW, RelationshipType.NIECE)
+        for relationship_type in (
+            RelationshipType.BROTHER_FULL,
+            RelationshipType.BROTHER_PARENTAL,
+            RelationshipType.BROTHER_MATERNAL,
+            RelationshipType.SISTER_FULL,
+            RelationshipType.SISTER_PARENTAL,
+            RelationshipType.SISTER_MATERNAL,
+            RelationshipType.NEPHEW,
+            RelationshipType.NIECE,
+        )
+    },
+    # Uncles, aunts and cousins
+    **{
+        relationship_type: (RelationshipType.COUSIN, RelationshipType.COUSIN)
+        for relationship_type in (
+            RelationshipType.PARENTAL_UNCLE_FULL,
+            RelationshipType.PARENTAL_UNCLE_PARENTAL,
+            RelationshipType.PARENTAL_UNCLE_MATERNAL,
+            RelationshipType.PARENTAL_AUNT_FULL,
+            RelationshipType.PARENTAL_AUNT_PARENTAL,
+            RelationshipType.PARENTAL_AUNT_MATERNAL,
+            RelationshipType.MATERNAL_UNCLE_FULL,
+            RelationshipType.MATERNAL_UNCLE_PARENTAL,
+            RelationshipType.MATERNAL_UNCLE_MATERNAL,
+            RelationshipType.MATERNAL_AUNT_FULL,
+            RelationshipType.MATERNAL_AUNT_PARENTAL,
+            RelationshipType.MATERNAL_AUNT_MATERNAL,
+            RelationshipType.COUSIN,
+        )
+    },
+}
+
+# Relationship type of a child, keyed by (parent relationship type, child gender)
+CHILDREN_RELATIONSHIP_MAPPING: Dict[
+    Tuple[RelationshipType, Gender], RelationshipType
+] = {
+    (relationship_type, gender): male_type if gender == Gender.MALE else other_type
+    for relationship_type, (
+        male_type,
+        other_type,
+    ) in _CHILDREN_RELATIONSHIP_TYPES.items()
+    for gender in Gender
+}
+
+# Relationship types whose parents are related to the deceased, mapped to the
+# relationship types given to their (father, mother)
+PARENTS_RELATIONSHIP_MAPPING: Dict[
+    RelationshipType, Tuple[RelationshipType, RelationshipType]
+] = {
+    RelationshipType.SELF: (RelationshipType.FATHER, RelationshipType.MOTHER),
+    **{
+        relationship_type: (RelationshipType.GRANDFATHER, RelationshipType.GRANDMOTHER)
+        for relationship_type in ANCESTOR_RELATIONSHIPS
+    },
+}
+
+# Relationship types that are blocked from inheriting (hijb) when the deceased has a
+# child of the key relationship type
+BLOCKED_RELATIONSHIPS: Dict[RelationshipType, FrozenSet[RelationshipType]] = {
+    RelationshipType.SON: frozenset(
+        {RelationshipType.NEPHEW, RelationshipType.NIECE, RelationshipType.COUSIN}
+    ),
+}
+
+
 class FamilyTree:
     """
     Represents a family tree structure optimized for Islamic inheritance calculations.
@@ -53,84 +153,151 @@ class FamilyTree:
     4. Support the calculation of inheritance shares
     """
 
-    def __init__(self, deceased: Person):
+    def __init__(self, deceased: Person, heirs_only: bool = False):
         """
         Initialize a family tree, with a deceased person as the focal point.
 
         Args:
             deceased: The deceased person whose inheritance is being calculated
+            heirs_only: If True, skip the relatives that are blocked from inheriting
+                by the surviving children of the deceased (e.g. nephews and cousins when there
+                is a son), along with their descendants
         """
         self.deceased = deceased
-        self._relationships: Dict[RelationshipType, Set[Relationship]] = defaultdict(
-            set
+        self.heirs_only = heirs_only
+        self._relationships: Dict[RelationshipType, List[Relationship]] = defaultdict(
+            list
         )
+        self._relatives_by_type: Optional[Dict[RelationshipType, FrozenSet[Person]]] = (
+            None
+        )
+        # Relationship of each person to the deceased, keyed by id(person)
+        self._relationship_by_person: Dict[int, Relationship] = {}
+        self._all_members: Optional[FrozenSet[Person]] = None
+        self._all_deceased: Optional[FrozenSet[Person]] = None
+        # Text visualizations, keyed by the language they were rendered in
+        self._visualizations: Dict[str, str] = {}
         self._generate_relationships()
 
     @classmethod
-    def change_focal_point(cls, person: Person) -> "FamilyTree":
-        return cls(person)
+    def change_focal_point(
+        cls, person: Person, heirs_only: bool = False
+    ) -> "FamilyTree":
+        return cls(person, heirs_only)
 
-    def get_relatives(self, relationship_type: RelationshipType) -> Set[Person]:
+    def get_relatives(self, relationship_type: RelationshipType) -> FrozenSet[Person]:
         """
         Get all relatives of a specific relationship type.
 
+        The result is looked up in the cached mapping of `get_relatives_by_type`,
+        so repeated calls do not rebuild the set.
+
         Args:
             relationship_type: The type of relationship to retrieve (e.g., siblings, descendants, etc.)
 
         Returns:
-            A set of people who have the specified relationship to the deceased.
+            A frozen set of people who have the specified relationship to the deceased.
+        """
+        return self.get_relatives_by_type().get(relationship_type, frozenset())
+
+    def get_relatives_by_type(self) -> Dict[RelationshipType, FrozenSet[Person]]:
+        """
+        Get all relatives of the deceased, grouped by relationship type.
+
+        The relationships never change once the tree is built, so the mapping is
+        computed on the first call and reused afterwards.
+
+        Returns:
+            A dictionary mapping each relationship type to the people who have that
+            relationship to the deceased. Types without any relative are omitted.
+        """
+        if self._relatives_by_type is None:
+            self._relatives_by_type = {
+                relationship_type: frozenset(rel.person for rel in relationships)
+                for relationship_type, relationships in self._relationships.items()
+                if relationships
+            }
+        return self._relatives_by_type
+
+    def get_relationship(self, person: Person) -> Optional[Relationship]:
+        """
+        Get the relationship of a person to the deceased.
+
+        The relationships are indexed by person while the tree is built, so this is
+        a single dictionary lookup.
+
+        Args:
+            person: The person to look up
+
+        Returns:
+            The relationship of the person to the deceased, or None if the person is
+            not related to the deceased.
         """
-        return {rel.person for rel in self._relationships[relationship_type]}
+        return self._relationship_by_person.get(id(person))
 
-    def get_siblings(self) -> Set[Person]:
+    def get_siblings(self) -> FrozenSet[Person]:
         """
         Get all siblings of the deceased.
         """
-        return {
-            rel.person
-            for relations in self._relationships.values()
-            for rel in relations
-            if rel.is_sibling
-        }
+        relatives = self.get_relatives_by_type()
+        return frozenset().union(
+            *(relatives.get(rt, ()) for rt in SIBLING_RELATIONSHIPS)
+        )
 
-    def get_uncles_and_aunts(self) -> Set[Person]:
+    def get_uncles_and_aunts(self) -> FrozenSet[Person]:
         """
         Get all uncles of the deceased.
         """
-        return {
-            rel.person
-            for relations in self._relationships.values()
-            for rel in relations
-            if rel.is_uncle_or_aunt
-        }
+        relatives = self.get_relatives_by_type()
+        return frozenset().union(
+            *(relatives.get(rt, ()) for rt in UNCLE_AND_AUNT_RELATIONSHIPS)
+        )
 
-    def get_all_members(self) -> Set[Person]:
+    def get_all_members(self) -> FrozenSet[Person]:
         """
         Get all members of the family tree.
 
+        Members are found by walking the live `Person` graph (children, spouses and
+        parents), which is mutable. The result is a snapshot taken on the first call
+        and reused afterwards: people linked to the graph later are not included.
+        Build a new FamilyTree to pick them up.
+
         Returns:
-            A list of all people in the family tree.
-        """
-        members = {self.deceased}
-        queue = [self.deceased]
-        while queue:
-            person = queue.pop()
-            for relative in itertools.chain(
-                person.children, person.spouses, [person.father, person.mother]
-            ):
-                if relative and relative not in members:
-                    members.add(relative)
-                    queue.append(relative)
-        return members
-
-    def get_all_deceased(self) -> Set[Person]:
+            A set of all people in the family tree, as of the first call.
+        """
+        if self._all_members is None:
+            # Expand one generation of relatives at a time with set operations
+            members = {self.deceased}
+            frontier = members.copy()
+            while frontier:
+                relatives = set()
+                for person in frontier:
+                    relatives.update(person.children)
+                    relatives.update(person.spouses)
+                    if person.father:
+                        relatives.add(person.father)
+                    if person.mother:
+                        relatives.add(person.mother)
+                frontier = relatives - members
+                members |= frontier
+            self._all_members = frozenset(members)
+        return self._all_members
+
+    def get_all_deceased(self) -> FrozenSet[Person]:
         """
         Get all deceased family members.
 
+        Like `get_all_members`, this is a snapshot taken on the first call: later
+        changes to the graph or to a person's death year are not reflected.
+
         Returns:
-            A set of all deceased people in the family tree.
+            A set of all deceased people in the family tree, as of the first call.
         """
-        return {person for person in self.get_all_members() if person.is_deceased}
+        if self._all_deceased is None:
+            self._all_deceased = frozenset(
+                person for person in self.get_all_members() if person.is_deceased
+            )
+        return self._all_deceased
 
     def get_heirs(self, madhhab: Optional[Madhhab] = None) -> List[Heir]:
         """
@@ -168,207 +335,244 @@ class FamilyTree:
         """
         Generate a visual representation of the family tree.
 
+        The text is a snapshot taken on the first call for each language and reused
+        afterwards. Besides the relationships, the visualizer reads live `Person`
+        attributes (e.g. the children of each son), so changes made to the graph
+        after that call are not reflected. Build a new FamilyTree to render them.
+
         Returns:
             A string representation of the family tree, where each line represents a relationship.
         """
-        # Import here to avoid circular imports
-        from ..visualizers import FamilyTreeTextVisualizer
+        language = get_language()
+        if language not in self._visualizations:
+            # Import here to avoid circular imports
+            from ..visualizers import FamilyTreeTextVisualizer
 
-        # Create a text visualizer and return its output
-        visualizer = FamilyTreeTextVisualizer(self)
-        return visualizer.visualize()
+            # Create a text visualizer and cache its output
+            visualizer = FamilyTreeTextVisualizer(self)
+            self._visualizations[language] = visualizer.visualize()
+        return self._visualizations[language]
 
     def _generate_relationships(self) -> None:
         """
         Generate relationships between family members.
 
         This method populates the `_relationships` dictionary with relationships to the deceased.
-        The dictionary maps each relationship type to a set of people who have that relationship.
+        The dictionary maps each relationship type to the list of relationships of that type.
+        Each person is added at most once, so the lists hold no duplicates.
         """
-        self._process_descendants()
-        self._process_ancestors()
+        self._process_relatives()
         # process spouses
         relationship_type = (
             RelationshipType.HUSBAND
             if self.deceased.gender == Gender.FEMALE
             else RelationshipType.WIFE
         )
+        # Spouses share the same one-step lineage
+        lineage = (relationship_type,)
         for spouse in self.deceased.spouses:
-            self._relationships[relationship_type].add(
-                Relationship(
-                    person=spouse,
-                    relationship_type=relationship_type,
-                    lineage=[relationship_type],
-                )
+            relationship = Relationship(
+                person=spouse,
+                relationship_type=relationship_type,
+                lineage=lineage,
             )
-
-    def _process_descendants(self) -> None:
+            self._relationships[relationship_type].append(relationship)
+            # A spouse who is also a blood relative keeps their blood relationship
+            self._relationship_by_person.setdefault(id(spouse), relationship)
+        # The relationships are complete: turn the defaultdict into a plain
+        # dictionary, so that looking up a missing type cannot add an empty bucket
+        self._relationships = dict(self._relationships)
+
+    def _process_relatives(self) -> None:
         """
-        Process the descendants of the deceased person and add them to the family tree.
+        Process the blood relatives of the deceased person and add them to the family tree.
 
-        This method traverses the family tree downward from the deceased person,
-        adding children, grandchildren, etc.
-        """
-        # Start with the children of the deceased
-        stack = []
-        for child in self.deceased.children:
-            relationship_type = (
-                RelationshipType.SON
-                if child.gender == Gender.MALE
-                else RelationshipType.DAUGHTER
-            )
-            stack.append(
-                Relationship(
-                    person=child,
-                    relationship_type=relationship_type,
-                    lineage=[relationship_type],
-                )
-            )
+        This method traverses the family tree from the deceased person in a single pass,
+        going downward to children, grandchildren, etc. and upward to parents,
+        grandparents, and their descendants (siblings, uncles, etc.).
 
-        # Keep track of processed people to avoid cycles
-        seen = set()
+        The descendants of the deceased are processed first, so a descendant who is
+        also related through a collateral relative (e.g. a grandson whose mother is
+        the deceased's niece) is always recorded as a descendant. The other relatives
+        are then processed breadth-first, so a person related to the deceased in more
+        than one way is recorded with their closest relationship.
 
-        # Process the stack
-        while stack:
-            relationship = stack.pop()
-            # Check for circular references
-            if id(relationship.person) in seen:
-                raise ValueError("Circular reference detected in family tree")
+        Raises:
+            ValueError: If a descendant of the deceased is their own ancestor, which
+                means the family tree contains a circular reference
+        """
+        queue = deque([Relationship(self.deceased, RelationshipType.SELF, ())])
+        # Descendants are queued apart and drained first, so that the whole subtree
+        # of the deceased is recorded before any collateral path can claim one of
+        # its members, e.g. a great-grandson whose mother is the deceased's sister
+        descendants: Deque[Relationship] = deque()
+        # Keep track of processed people to avoid cycles. People are keyed by id()
+        # directly, which is cheaper than going through Person.__hash__. The index
+        # of relationships by person doubles as the set of processed people.
+        seen = self._relationship_by_person
+        relationships = self._relationships
+        blocked = self._blocked_relationship_types()
+        create_child_relationship = self._create_child_relationship
+
+        # Process the queue
+        while descendants or queue:
+            relationship = descendants.popleft() if descendants else queue.popleft()
+            person = relationship.person
+            person_id = id(person)
+
+            if person_id in seen:
+                # A descendant reached twice is either the child of two descendants,
+                # e.g. when cousins marry, or part of a cycle. Checking the ancestry
+                # is only needed on this rare path.
+                if relationship.is_descendant and self._is_own_ancestor(person):
+                    raise ValueError("Circular reference detected in family tree")
+                # Skip if already processed
+                continue
 
             # Add current relationship to the family tree
-            self._relationships[relationship.relationship_type].add(relationship)
-            seen.add(id(relationship.person))
-
-            # Process the person's children
-            for grandchild in relationship.person.children:
-                relationship_type = (
-                    RelationshipType.GRANDSON
-                    if grandchild.gender == Gender.MALE
-                    else RelationshipType.GRANDDAUGHTER
-                )
-                lineage = relationship.lineage + [
-                    (
-                        RelationshipType.SON
-                        if relationship.person.gender == Gender.MALE
-                        else RelationshipType.DAUGHTER
-                    )
-                ]
-                stack.append(
-                    Relationship(
-                        person=grandchild,
-                        relationship_type=relationship_type,
-                        lineage=lineage,
+            relationships[relationship.relationship_type].append(relationship)
+            seen[person_id] = relationship
+            children = person.children
+
+            if relationship.is_descendant:
+                # Descendants: process their children without filtering, so that
+                # circular references are detected
+                if children:
+                    descendants.extend(
+                        create_child_relationship(relationship, child)
+                        for child in children
                     )
+                continue
+
+            if relationship.relationship_type == RelationshipType.SELF:
+                # Process children, then parents and siblings
+                descendants.extend(
+                    create_child_relationship(relationship, child) for child in children
+                )
+                next_relationships = itertools.chain(
+                    self._create_parent_relationships(relationship),
+                    self._collect_siblings(relationship),
+                )
+            elif relationship.is_ancestor:
+                # Process parents and siblings
+                next_relationships = itertools.chain(
+                    self._create_parent_relationships(relationship),
+                    self._collect_siblings(relationship),
                 )
+            elif relationship.is_collateral:
+                # Collateral relatives: process descendants, skipping the children
+                # that were already processed before creating their relationships
+                if not children:
+                    continue
+                next_relationships = (
+                    create_child_relationship(relationship, child)
+                    for child in children
+                    if id(child) not in seen
+                )
+            else:
+                continue
 
-    def _process_ancestors(self) -> None:
-        """
-        Process the ancestors of the deceased person and add them to the family tree.
+            # Only push people that have not been processed yet and are not blocked
+            queue.extend(
+                rel
+                for rel in next_relationships
+                if id(rel.person) not in seen and rel.relationship_type not in blocked
+            )
 
-        This method traverses the family tree upward from the deceased person,
-        adding parents, grandparents, and their descendants (siblings, uncles, etc.).
+    @staticmethod
+    def _is_own_ancestor(person: Person) -> bool:
         """
-        # Start with the parents of the deceased
-        stack = [Relationship(self.deceased, RelationshipType.SELF, [])]
-        # Keep track of processed people to avoid cycles
-        seen = set()
+        Check whether a person appears among their own ancestors.
 
-        # Process the stack
-        while stack:
-            relationship = stack.pop()
+        Args:
+            person: The person to check
 
-            # Skip if already processed
-            if id(relationship.person) in seen:
+        Returns:
+            True if the person can be reached by walking up from their parents.
+        """
+        visited = set()
+        stack = [parent for parent in (person.father, person.mother) if parent]
+        while stack:
+            ancestor = stack.pop()
+            if ancestor is person:
+                return True
+            if id(ancestor) in visited:
                 continue
+            visited.add(id(ancestor))
+            if ancestor.father:
+                stack.append(ancestor.father)
+            if ancestor.mother:
+                stack.append(ancestor.mother)
+        return False
+
+    def _blocked_relationship_types(self) -> FrozenSet[RelationshipType]:
+        """
+        Get the relationship types that are blocked by the surviving children of the
+        deceased.
 
-            # Add current relationship to the family tree
-            self._relationships[relationship.relationship_type].add(relationship)
-            seen.add(id(relationship.person))
+        A child survives the deceased if they are alive, or if they died in a later
+        year than the deceased. Any other child who has died, including one whose
+        death cannot be ordered against the deceased's, blocks nobody.
 
-            is_ancestor_including_self = relationship.is_ancestor or (
-                relationship.relationship_type == RelationshipType.SELF
-            )
-            if is_ancestor_including_self:
-                # Process parents
-                stack.extend(self._create_parent_relationships(relationship))
-                # Process siblings
-                stack.extend(
-                    [
-                        rel
-                        for rel in self._collect_siblings(relationship)
-                        if id(rel.person) not in seen
-                    ]
-                )
-            elif relationship.is_sibling or relationship.is_nephew_or_niece:
-                # Siblings: process descendants
-                stack.extend(
-                    [
-                        Relationship(
-                            person=child,
-                            relationship_type=(
-                                RelationshipType.NEPHEW
-                                if child.gender == Gender.MALE
-                                else RelationshipType.NIECE
-                            ),
-                            lineage=relationship.lineage
-                            + [
-                                (
-                                    RelationshipType.SON
-                                    if child.gender == Gender.MALE
-                                    else RelationshipType.DAUGHTER
-                                )
-                            ],
-                        )
-                        for child in relationship.person.children
-                    ]
-                )
-            elif relationship.is_uncle_or_aunt or relationship.is_cousin:
-                stack.extend(
-                    [
-                        Relationship(
-                            person=cousin,
-                            relationship_type=RelationshipType.COUSIN,
-                            lineage=relationship.lineage
-                            + [
-                                (
-                                    RelationshipType.SON
-                                    if cousin.gender == Gender.MALE
-                                    else RelationshipType.DAUGHTER
-                                )
-                            ],
-                        )
-                        for cousin in relationship.person.children
-                    ]
+        Returns:
+            The relationship types to skip while traversing the family tree, which is
+            always empty unless the tree is built with `heirs_only`.
+        """
+        if not self.heirs_only:
+            return frozenset()
+        death_year = self.deceased.death_year
+        return frozenset().union(
+            *(
+                BLOCKED_RELATIONSHIPS.get(
+                    CHILDREN_RELATIONSHIP_MAPPING[
+                        (RelationshipType.SELF, child.gender)
+                    ],
+                    frozenset(),
                 )
+                for child in self.deceased.children
+                if child.is_alive
+                or (death_year is not None and child.death_year > death_year)
+            )
+        )
+
+    @staticmethod
+    def _create_child_relationship(
+        relationship: Relationship, child: Person
+    ) -> Relationship:
+        """
+        Create the relationship of a child of the person in the given relationship.
+        """
+        gender = child.gender
+        return Relationship(
+            person=child,
+            relationship_type=CHILDREN_RELATIONSHIP_MAPPING[
+                (relationship.relationship_type, gender)
+            ],
+            lineage=(*relationship.lineage, CHILD_LINEAGE_RELATIONSHIP[gender]),
+        )
 
     def _create_parent_relationships(
         self, relationship: Relationship
     ) -> List[Relationship]:
         result = []
-        if relationship.person.father:
-            relationship_type = (
-                RelationshipType.GRANDFATHER
-                if relationship.is_ancestor
-                else RelationshipType.FATHER
-            )
+        person = relationship.person
+        father_type, mother_type = PARENTS_RELATIONSHIP_MAPPING[
+            relationship.relationship_type
+        ]
+        if person.father:
             result.append(
                 Relationship(
-                    person=relationship.person.father,
-                    relationship_type=relationship_type,
-                    lineage=relationship.lineage + [RelationshipType.FATHER],
+                    person=person.father,
+                    relationship_type=father_type,
+                    lineage=(*relationship.lineage, RelationshipType.FATHER),
                 )
             )
-        if relationship.person.mother:
-            relationship_type = (
-                RelationshipType.GRANDMOTHER
-                if relationship.is_ancestor
-                else RelationshipType.MOTHER
-            )
+        if person.mother:
             result.append(
                 Relationship(
-                    person=relationship.person.mother,
-                    relationship_type=relationship_type,
-                    lineage=relationship.lineage + [RelationshipType.MOTHER],
+                    person=person.mother,
+                    relationship_type=mother_type,
+                    lineage=(*relationship.lineage, RelationshipType.MOTHER),
                 )
             )
         return result
@@ -377,56 +581,39 @@ class FamilyTree:
         """
         Process sibling of a person
         """
-        child_relationships = []
         person = relationship.person
-        parental_brothers = set()
-        maternal_brothers = set()
-        if person.father:
-            parental_brothers = {
-                sibling for sibling in person.father.children if sibling != person
-            }
-        if person.mother:
-            maternal_brothers = {
-                sibling for sibling in person.mother.children if sibling != person
-            }
+        if not person.father and not person.mother:
+            # Without parents, there are no siblings to look for
+            return []
 
-        full_brothers = parental_brothers.intersection(maternal_brothers)
-        parental_brothers = parental_brothers.difference(full_brothers)
-        maternal_brothers = maternal_brothers.difference(full_brothers)
-
-        for child, lineage_type in itertools.chain(
-            zip(full_brothers, [LineageType.FULL] * len(full_brothers)),
-            zip(parental_brothers, [LineageType.PARENTAL] * len(parental_brothers)),
-            zip(maternal_brothers, [LineageType.MATERNAL] * len(maternal_brothers)),
-        ):
-            config = ANCESTORS_SIBLINGS_RELATIONSHIPS[relationship.relationship_type][
-                lineage_type
-            ][child.gender]
-            # copy the lineage to avoid modifying the original
-            new_lineage = relationship.lineage[:]
-            match config.lineage_operation:
-                case LineageOperation.PUSH_RELATIONSHIP:
-                    new_lineage.append(config.relationship_type)
-                case LineageOperation.POP_THEN_PUSH_RELATIONSHIP:
-                    new_lineage.pop()
-                    new_lineage.append(config.relationship_type)
-                case LineageOperation.PUSH_PARENTAL_RELATIONSHIP:
-                    relationship_type = (
-                        RelationshipType.SON
-                        if child.gender == Gender.MALE
-                        else RelationshipType.DAUGHTER
-                    )
-                    new_lineage.append(relationship_type)
-                case _:
-                    raise ValueError(
-                        f"Unknown lineage operation: {config.lineage_operation.name}"
-                    )
+        child_relationships = []
+        father_children = person.father.children if person.father else set()
+        mother_children = person.mother.children if person.mother else set()
 
+        # Classify the siblings in a single pass over each parent's children
+        siblings = []
+        for sibling in father_children:
+            if sibling is person:
+                continue
+            if sibling in mother_children:
+                siblings.append((sibling, LineageType.FULL))
+            else:
+                siblings.append((sibling, LineageType.PARENTAL))
+        for sibling in mother_children:
+            if sibling is not person and sibling not in father_children:
+                siblings.append((sibling, LineageType.MATERNAL))
+
+        person_type = relationship.relationship_type
+        lineage = relationship.lineage
+        for child, lineage_type in siblings:
+            relationship_type, lineage_end, lineage_relationship = (
+                SIBLINGS_RELATIONSHIP_MAPPING[(person_type, lineage_type, child.gender)]
+            )
             child_relationships.append(
                 Relationship(
                     person=child,
-                    relationship_type=config.relationship_type,
-                    lineage=new_lineage,
+                    relationship_type=relationship_type,
+                    lineage=(*lineage[:lineage_end], lineage_relationship),
                 )
             )
 
@@ -596,3 +783,51 @@ ANCESTORS_SIBLINGS_RELATIONSHIPS = {
         },
     },
 }
+
+
+def _resolve_lineage_operation(
+    config: RelationshipConfig, gender: Gender
+) -> Tuple[Optional[int], RelationshipType]:
+    """
+    Resolve the lineage operation of a sibling's configuration.
+
+    Args:
+        config: The configuration of the sibling's relationship
+        gender: The gender of the sibling
+
+    Returns:
+        The end of the slice of the lineage to keep, and the relationship type to push
+        onto it.
+
+    Raises:
+        ValueError: If the lineage operation is unknown
+    """
+    match config.lineage_operation:
+        case LineageOperation.PUSH_RELATIONSHIP:
+            return None, config.relationship_type
+        case LineageOperation.POP_THEN_PUSH_RELATIONSHIP:
+            return -1, config.relationship_type
+        case LineageOperation.PUSH_PARENTAL_RELATIONSHIP:
+            return None, CHILD_LINEAGE_RELATIONSHIP[gender]
+        case _:
+            raise ValueError(
+                f"Unknown lineage operation: {config.lineage_operation.name}"
+            )
+
+
+# Flat view of ANCESTORS_SIBLINGS_RELATIONSHIPS, keyed by (relationship type,
+# lineage type, gender), so that a sibling's configuration is a single lookup. The
+# lineage operations are resolved here, once, to the sibling's relationship type,
+# the end of the slice of the lineage to keep and the relationship type to push.
+SIBLINGS_RELATIONSHIP_MAPPING: Dict[
+    Tuple[RelationshipType, LineageType, Gender],
+    Tuple[RelationshipType, Optional[int], RelationshipType],
+] = {
+    (relationship_type, lineage_type, gender): (
+        config.relationship_type,
+        *_resolve_lineage_operation(config, gender),
+    )
+    for relationship_type, by_lineage_type in ANCESTORS_SIBLINGS_RELATIONSHIPS.items()
+    for lineage_type, by_gender in by_lineage_type.items()
+    for gender, config in by_gender.items()
+}
@@ -1,13 +1,14 @@
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import List
+from enum import auto
+from typing import Tuple
 
+from .enums import IdentityHashEnum
 from .madhhab import Madhhab
 from .person import Person
 from .relationship import RelationshipType
 
 
-class HeirType(Enum):
+class HeirType(IdentityHashEnum):
     """The type of heirship."""
 
     # Spouses
@@ -47,7 +48,35 @@ class HeirType(Enum):
         return self.name
 
 
-@dataclass(frozen=True)
+# Heir types entitled to a fixed share (fardh)
+FARDH_HEIR_TYPES = frozenset(
+    {
+        HeirType.HUSBAND,
+        HeirType.WIFE,
+        HeirType.FATHER,
+        HeirType.MOTHER,
+        HeirType.DAUGHTER,
+        HeirType.SISTER_FULL,
+        HeirType.SISTER_PARENTAL,
+        HeirType.SISTER_MATERNAL,
+        HeirType.BROTHER_MATERNAL,
+    }
+)
+
+# Heir types entitled to the residue (taasib)
+TAASIB_HEIR_TYPES = frozenset(
+    {
+        HeirType.FATHER,
+        HeirType.SON,
+        HeirType.BROTHER_FULL,
+        HeirType.BROTHER_PARENTAL,
+        HeirType.UNCLE_FULL,
+        HeirType.UNCLE_PARENTAL,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Heir:
     """
     Represents a potential heir in Islamic inheritance calculations.
@@ -71,7 +100,7 @@ class Heir:
 
     person: Person
     heir_type: HeirType
-    lineage: List[RelationshipType]
+    lineage: Tuple[RelationshipType, ...]
     madhhab: Madhhab | None = None
 
     @property
@@ -84,25 +113,8 @@ class Heir:
 
     @property
     def is_fardh(self) -> bool:
-        return self.heir_type in (
-            HeirType.HUSBAND,
-            HeirType.WIFE,
-            HeirType.FATHER,
-            HeirType.MOTHER,
-            HeirType.DAUGHTER,
-            HeirType.SISTER_FULL,
-            HeirType.SISTER_PARENTAL,
-            HeirType.SISTER_MATERNAL,
-            HeirType.BROTHER_MATERNAL,
-        )
+        return self.heir_type in FARDH_HEIR_TYPES
 
     @property
     def is_taasib(self) -> bool:
-        return self.heir_type in (
-            HeirType.FATHER,
-            HeirType.SON,
-            HeirType.BROTHER_FULL,
-            HeirType.BROTHER_PARENTAL,
-            HeirType.UNCLE_FULL,
-            HeirType.UNCLE_PARENTAL,
-        )
+        return self.heir_type in TAASIB_HEIR_TYPES
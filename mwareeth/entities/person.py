@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Set
 
+from .enums import IdentityHashEnum
+
 
 class Religion(Enum):
     ISLAM = "Islam"
@@ -15,13 +17,13 @@ class Religion(Enum):
     OTHER = "other"
 
 
-class Gender(Enum):
+class Gender(IdentityHashEnum):
     UNKNOWN = "unknown"
     MALE = "male"
     FEMALE = "female"
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """Represents a person in the family tree."""
 
@@ -75,12 +77,14 @@ class Person:
 
     @property
     def fullname(self) -> str:
-        fullname = self.name.lower()
-        father = self.father
-        while father:
-            fullname = f"{father.name.lower()}>{fullname}"
-            father = father.father
-        return fullname
+        # Collect the names up the paternal line and join them once, rather than
+        # rebuilding the string for every ancestor
+        names = []
+        person = self
+        while person:
+            names.append(person.name.lower())
+            person = person.father
+        return ">".join(reversed(names))
 
     @property
     def is_alive(self) -> bool:
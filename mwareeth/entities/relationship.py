@@ -1,11 +1,11 @@
-from dataclasses import dataclass
-from enum import Enum
-from typing import List
+from dataclasses import dataclass, field
+from typing import Tuple
 
+from .enums import IdentityHashEnum
 from .person import Person
 
 
-class RelationshipType(Enum):
+class RelationshipType(IdentityHashEnum):
     """Enumerates possible relationships between family members."""
 
     SELF = "self"
@@ -58,23 +58,75 @@ class RelationshipType(Enum):
         return self.name
 
 
-# Set of ancestor relationship types for quick lookup
-ANCESTOR_RELATIONSHIPS = {
-    RelationshipType.FATHER,
-    RelationshipType.GRANDFATHER,
-    RelationshipType.MOTHER,
-    RelationshipType.GRANDMOTHER,
-}
-
-DESCENDANT_RELATIONSHIPS = {
-    RelationshipType.SON,
-    RelationshipType.DAUGHTER,
-    RelationshipType.GRANDSON,
-    RelationshipType.GRANDDAUGHTER,
-}
-
-
-@dataclass(frozen=True)
+# Immutable sets of relationship types for quick lookup
+ANCESTOR_RELATIONSHIPS = frozenset(
+    {
+        RelationshipType.FATHER,
+        RelationshipType.GRANDFATHER,
+        RelationshipType.MOTHER,
+        RelationshipType.GRANDMOTHER,
+    }
+)
+
+DESCENDANT_RELATIONSHIPS = frozenset(
+    {
+        RelationshipType.SON,
+        RelationshipType.DAUGHTER,
+        RelationshipType.GRANDSON,
+        RelationshipType.GRANDDAUGHTER,
+    }
+)
+
+SIBLING_RELATIONSHIPS = frozenset(
+    {
+        RelationshipType.BROTHER_FULL,
+        RelationshipType.BROTHER_PARENTAL,
+        RelationshipType.BROTHER_MATERNAL,
+        RelationshipType.SISTER_FULL,
+        RelationshipType.SISTER_PARENTAL,
+        RelationshipType.SISTER_MATERNAL,
+    }
+)
+
+UNCLE_AND_AUNT_RELATIONSHIPS = frozenset(
+    {
+        RelationshipType.PARENTAL_UNCLE_FULL,
+        RelationshipType.PARENTAL_UNCLE_PARENTAL,
+        RelationshipType.PARENTAL_UNCLE_MATERNAL,
+        RelationshipType.PARENTAL_AUNT_FULL,
+        RelationshipType.PARENTAL_AUNT_PARENTAL,
+        RelationshipType.PARENTAL_AUNT_MATERNAL,
+        RelationshipType.MATERNAL_UNCLE_FULL,
+        RelationshipType.MATERNAL_UNCLE_PARENTAL,
+        RelationshipType.MATERNAL_UNCLE_MATERNAL,
+        RelationshipType.MATERNAL_AUNT_FULL,
+        RelationshipType.MATERNAL_AUNT_PARENTAL,
+        RelationshipType.MATERNAL_AUNT_MATERNAL,
+    }
+)
+
+NEPHEW_AND_NIECE_RELATIONSHIPS = frozenset(
+    {
+        RelationshipType.NEPHEW,
+        RelationshipType.NIECE,
+    }
+)
+
+# Collateral relatives descend from an ancestor of the deceased without being
+# one of the deceased's ancestors or descendants
+COLLATERAL_RELATIONSHIPS = (
+    SIBLING_RELATIONSHIPS
+    | UNCLE_AND_AUNT_RELATIONSHIPS
+    | NEPHEW_AND_NIECE_RELATIONSHIPS
+    | {RelationshipType.COUSIN}
+)
+
+# Lineages are immutable, so parent relationships can all share one tuple
+_FATHER_LINEAGE = (RelationshipType.FATHER,)
+_MOTHER_LINEAGE = (RelationshipType.MOTHER,)
+
+
+@dataclass(frozen=True, slots=True)
 class Relationship:
     """
     Represents a relationship between two people in the family tree.
@@ -100,17 +152,25 @@ class Relationship:
 
     person: Person
     relationship_type: RelationshipType
-    lineage: List[RelationshipType]
+    lineage: Tuple[RelationshipType, ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Store the lineage as a tuple so it can be shared between relationships
+        lineage = tuple(self.lineage)
+        object.__setattr__(self, "lineage", lineage)
+        # The relationship is immutable, so hash the lineage path only once
+        object.__setattr__(self, "_hash", hash(lineage))
 
     @classmethod
     def father(cls, father: Person) -> "Relationship":
         """Create a father relationship."""
-        return cls(father, RelationshipType.FATHER, [RelationshipType.FATHER])
+        return cls(father, RelationshipType.FATHER, _FATHER_LINEAGE)
 
     @classmethod
     def mother(cls, mother: Person) -> "Relationship":
         """Create a mother relationship."""
-        return cls(mother, RelationshipType.MOTHER, [RelationshipType.MOTHER])
+        return cls(mother, RelationshipType.MOTHER, _MOTHER_LINEAGE)
 
     @property
     def degree(self) -> int:
@@ -130,32 +190,12 @@ class Relationship:
     @property
     def is_sibling(self) -> bool:
         """Check if the relationship is a sibling (brother, sister, etc.)."""
-        return self.relationship_type in {
-            RelationshipType.BROTHER_FULL,
-            RelationshipType.BROTHER_PARENTAL,
-            RelationshipType.BROTHER_MATERNAL,
-            RelationshipType.SISTER_FULL,
-            RelationshipType.SISTER_PARENTAL,
-            RelationshipType.SISTER_MATERNAL,
-        }
+        return self.relationship_type in SIBLING_RELATIONSHIPS
 
     @property
     def is_uncle_or_aunt(self) -> bool:
         """Check if the relationship is an uncle or aunt."""
-        return self.relationship_type in {
-            RelationshipType.PARENTAL_UNCLE_FULL,
-            RelationshipType.PARENTAL_UNCLE_PARENTAL,
-            RelationshipType.PARENTAL_UNCLE_MATERNAL,
-            RelationshipType.PARENTAL_AUNT_FULL,
-            RelationshipType.PARENTAL_AUNT_PARENTAL,
-            RelationshipType.PARENTAL_AUNT_MATERNAL,
-            RelationshipType.MATERNAL_UNCLE_FULL,
-            RelationshipType.MATERNAL_UNCLE_PARENTAL,
-            RelationshipType.MATERNAL_UNCLE_MATERNAL,
-            RelationshipType.MATERNAL_AUNT_FULL,
-            RelationshipType.MATERNAL_AUNT_PARENTAL,
-            RelationshipType.MATERNAL_AUNT_MATERNAL,
-        }
+        return self.relationship_type in UNCLE_AND_AUNT_RELATIONSHIPS
 
     @property
     def is_cousin(self) -> bool:
@@ -165,14 +205,16 @@ class Relationship:
     @property
     def is_nephew_or_niece(self) -> bool:
         """Check if the relationship is a nephew or niece."""
-        return self.relationship_type in {
-            RelationshipType.NEPHEW,
-            RelationshipType.NIECE,
-        }
+        return self.relationship_type in NEPHEW_AND_NIECE_RELATIONSHIPS
+
+    @property
+    def is_collateral(self) -> bool:
+        """Check if the relationship is a sibling, uncle, aunt, cousin, nephew or niece."""
+        return self.relationship_type in COLLATERAL_RELATIONSHIPS
 
     def __hash__(self) -> int:
         """Generate a hash based on the lineage path."""
-        return "-".join(rel.name for rel in self.lineage).__hash__()
+        return self._hash
 
     def __repr__(self) -> str:
         return f"<Relationship: person:{self.person.name}, relation:{self.relationship_type.name}>"
@@ -22,6 +22,12 @@ class TestRelationshipType(unittest.TestCase):
         self.assertEqual(RelationshipType.GRANDFATHER.value, "grandfather")
         self.assertEqual(RelationshipType.GRANDMOTHER.value, "grandmother")
 
+    def test_relationship_types_are_hashable_keys(self):
+        """Test that relationship types can be looked up by member in a dict."""
+        labels = {rt: rt.value for rt in RelationshipType}
+        self.assertEqual(labels[RelationshipType.FATHER], "father")
+        self.assertEqual(len(labels), len(RelationshipType))
+
 
 class TestRelationship(unittest.TestCase):
     """Tests for the Relationship class."""
@@ -34,21 +40,21 @@ class TestRelationship(unittest.TestCase):
             [RelationshipType.FATHER],
         )
         self.assertEqual(relationship.relationship_type, RelationshipType.FATHER)
-        self.assertEqual(relationship.lineage, [RelationshipType.FATHER])
+        self.assertEqual(relationship.lineage, (RelationshipType.FATHER,))
         self.assertEqual(relationship.degree, 1)
 
     def test_father_factory_method(self):
         """Test the father factory method."""
         relationship = Relationship.father(Person("Ali", Gender.MALE))
         self.assertEqual(relationship.relationship_type, RelationshipType.FATHER)
-        self.assertEqual(relationship.lineage, [RelationshipType.FATHER])
+        self.assertEqual(relationship.lineage, (RelationshipType.FATHER,))
         self.assertEqual(relationship.degree, 1)
 
     def test_mother_factory_method(self):
         """Test the mother factory method."""
         relationship = Relationship.mother(Person("Ali", Gender.FEMALE))
         self.assertEqual(relationship.relationship_type, RelationshipType.MOTHER)
-        self.assertEqual(relationship.lineage, [RelationshipType.MOTHER])
+        self.assertEqual(relationship.lineage, (RelationshipType.MOTHER,))
         self.assertEqual(relationship.degree, 1)
 
     def test_is_ancestor_property(self):
@@ -56,22 +62,22 @@ class TestRelationship(unittest.TestCase):
         father = Relationship(
             Person("father", Gender.MALE),
             RelationshipType.FATHER,
-            [RelationshipType.FATHER],
+            (RelationshipType.FATHER,),
         )
         mother = Relationship(
             Person("mother", Gender.FEMALE),
             RelationshipType.MOTHER,
-            [RelationshipType.MOTHER],
+            (RelationshipType.MOTHER,),
         )
         grandfather = Relationship(
             Person("father", Gender.MALE),
             RelationshipType.GRANDFATHER,
-            [RelationshipType.FATHER, RelationshipType.FATHER],
+            (RelationshipType.FATHER, RelationshipType.FATHER),
         )
         grandmother = Relationship(
             Person("grandmother", Gender.FEMALE),
             RelationshipType.GRANDMOTHER,
-            [RelationshipType.MOTHER, RelationshipType.MOTHER],
+            (RelationshipType.MOTHER, RelationshipType.MOTHER),
         )
 
         self.assertTrue(father.is_ancestor)
@@ -79,31 +85,73 @@ class TestRelationship(unittest.TestCase):
         self.assertTrue(grandfather.is_ancestor)
         self.assertTrue(grandmother.is_ancestor)
 
+    def test_is_collateral_property(self):
+        """Test the is_collateral property."""
+        uncle = Relationship(
+            Person("Uncle", Gender.MALE),
+            RelationshipType.PARENTAL_UNCLE_FULL,
+            (RelationshipType.FATHER, RelationshipType.BROTHER_FULL),
+        )
+        cousin = Relationship(
+            Person("Cousin", Gender.FEMALE),
+            RelationshipType.COUSIN,
+            (
+                RelationshipType.FATHER,
+                RelationshipType.BROTHER_FULL,
+                RelationshipType.DAUGHTER,
+            ),
+        )
+
+        self.assertTrue(uncle.is_collateral)
+        self.assertTrue(cousin.is_collateral)
+        self.assertFalse(
+            Relationship.father(Person("Father", Gender.MALE)).is_collateral
+        )
+
+    def test_hash_is_based_on_lineage(self):
+        """Test that relationships with the same lineage share the same hash."""
+        brother = Relationship(
+            Person("Brother", Gender.MALE),
+            RelationshipType.BROTHER_FULL,
+            (RelationshipType.BROTHER_FULL,),
+        )
+        other_brother = Relationship(
+            Person("Other Brother", Gender.MALE),
+            RelationshipType.BROTHER_FULL,
+            (RelationshipType.BROTHER_FULL,),
+        )
+
+        self.assertEqual(hash(brother), hash(other_brother))
+        self.assertNotEqual(brother, other_brother)
+        self.assertEqual(len({brother, other_brother}), 2)
+
 
 class TestFamilyTree(unittest.TestCase):
     """Tests for the FamilyTree class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a simple family tree for testing
-        self.deceased = Person("Deceased", Gender.MALE)
-        self.father = Person("Father", Gender.MALE)
-        self.mother = Person("Mother", Gender.FEMALE)
-        self.grandfather_paternal = Person("Paternal Grandfather", Gender.MALE)
-        self.grandmother_paternal = Person("Paternal Grandmother", Gender.FEMALE)
-        self.grandfather_maternal = Person("Maternal Grandfather", Gender.MALE)
-        self.grandmother_maternal = Person("Maternal Grandmother", Gender.FEMALE)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test."""
+        # Create a simple family tree for testing. It is only read by the tests,
+        # so it is built once for the whole class
+        cls.deceased = Person("Deceased", Gender.MALE)
+        cls.father = Person("Father", Gender.MALE)
+        cls.mother = Person("Mother", Gender.FEMALE)
+        cls.grandfather_paternal = Person("Paternal Grandfather", Gender.MALE)
+        cls.grandmother_paternal = Person("Paternal Grandmother", Gender.FEMALE)
+        cls.grandfather_maternal = Person("Maternal Grandfather", Gender.MALE)
+        cls.grandmother_maternal = Person("Maternal Grandmother", Gender.FEMALE)
 
         # Set up relationships
-        self.deceased.add_father(self.father)
-        self.deceased.add_mother(self.mother)
-        self.father.add_father(self.grandfather_paternal)
-        self.father.add_mother(self.grandmother_paternal)
-        self.mother.add_father(self.grandfather_maternal)
-        self.mother.add_mother(self.grandmother_maternal)
+        cls.deceased.add_father(cls.father)
+        cls.deceased.add_mother(cls.mother)
+        cls.father.add_father(cls.grandfather_paternal)
+        cls.father.add_mother(cls.grandmother_paternal)
+        cls.mother.add_father(cls.grandfather_maternal)
+        cls.mother.add_mother(cls.grandmother_maternal)
 
         # Create the family tree
-        self.family_tree = FamilyTree(self.deceased)
+        cls.family_tree = FamilyTree(cls.deceased)
 
     def test_initialization(self):
         """Test that a FamilyTree can be initialized with a deceased person."""
@@ -246,6 +294,164 @@ class TestFamilyTree(unittest.TestCase):
             granddaughter, family_tree.get_relatives(RelationshipType.GRANDDAUGHTER)
         )
 
+    def test_process_descendants_lineage(self):
+        """Test that each descendant's lineage ends with their own gender."""
+        deceased = Person("Deceased", Gender.MALE)
+        son = Person("Son", Gender.MALE)
+        granddaughter = Person("Granddaughter", Gender.FEMALE)
+        deceased.add_child(son)
+        son.add_child(granddaughter)
+
+        family_tree = FamilyTree(deceased)
+
+        (relationship,) = family_tree._relationships[RelationshipType.GRANDDAUGHTER]
+        self.assertEqual(
+            relationship.lineage, (RelationshipType.SON, RelationshipType.DAUGHTER)
+        )
+
+    def test_descendant_related_through_a_niece(self):
+        """Test that descendants whose mother is a niece are recorded as descendants."""
+        deceased = Person("Deceased", Gender.MALE)
+        father = Person("Father", Gender.MALE)
+        brother = Person("Brother", Gender.MALE)
+        son = Person("Son", Gender.MALE)
+        niece = Person("Niece", Gender.FEMALE)
+        grandson = Person("Grandson", Gender.MALE)
+        great_grandson = Person("Great Grandson", Gender.MALE)
+        great_great_grandson = Person("Great Great Grandson", Gender.MALE)
+        # Four generations below the deceased, but a single one below the niece
+        descendant = Person("Descendant", Gender.MALE)
+
+        deceased.add_father(father)
+        brother.add_father(father)
+        deceased.add_child(son)
+        brother.add_child(niece)
+        son.add_child(grandson)
+        niece.add_child(grandson)
+        grandson.add_child(great_grandson)
+        great_grandson.add_child(great_great_grandson)
+        great_great_grandson.add_child(descendant)
+        niece.add_child(descendant)
+
+        family_tree = FamilyTree(deceased)
+
+        self.assertEqual(
+            family_tree.get_relatives(RelationshipType.GRANDSON),
+            {grandson, great_grandson, great_great_grandson, descendant},
+        )
+        self.assertEqual(family_tree.get_relatives(RelationshipType.NEPHEW), set())
+        self.assertEqual(family_tree.get_relationship(descendant).degree, 5)
+
+    def test_descendant_whose_mother_is_a_sister(self):
+        """Test that a great-grandson whose mother is a sister stays a descendant."""
+        deceased = Person("Deceased", Gender.MALE)
+        father = Person("Father", Gender.MALE)
+        sister = Person("Sister", Gender.FEMALE)
+        son = Person("Son", Gender.MALE)
+        grandson = Person("Grandson", Gender.MALE)
+        great_grandson = Person("Great Grandson", Gender.MALE)
+
+        deceased.add_father(father)
+        sister.add_father(father)
+        deceased.add_child(son)
+        son.add_child(grandson)
+        grandson.add_child(great_grandson)
+        sister.add_child(great_grandson)
+
+        family_tree = FamilyTree(deceased)
+
+        self.assertEqual(
+            family_tree.get_relatives(RelationshipType.GRANDSON),
+            {grandson, great_grandson},
+        )
+        self.assertEqual(family_tree.get_relatives(RelationshipType.NEPHEW), set())
+        self.assertEqual(
+            family_tree.get_relationship(great_grandson).lineage,
+            (RelationshipType.SON, RelationshipType.SON, RelationshipType.SON),
+        )
+
+    def test_descendant_of_two_descendants(self):
+        """Test that a child of two married grandchildren is not a circular reference."""
+        deceased = Person("Deceased", Gender.MALE)
+        son = Person("Son", Gender.MALE)
+        daughter = Person("Daughter", Gender.FEMALE)
+        grandson = Person("Grandson", Gender.MALE)
+        granddaughter = Person("Granddaughter", Gender.FEMALE)
+        great_grandson = Person("Great Grandson", Gender.MALE)
+
+        deceased.add_child(son)
+        deceased.add_child(daughter)
+        son.add_child(grandson)
+        daughter.add_child(granddaughter)
+        grandson.add_child(great_grandson)
+        granddaughter.add_child(great_grandson)
+
+        family_tree = FamilyTree(deceased)
+
+        self.assertEqual(
+            family_tree.get_relatives(RelationshipType.GRANDSON),
+            {grandson, great_grandson},
+        )
+
+    def test_heirs_only_skips_blocked_relatives(self):
+        """Test that heirs_only skips nephews and cousins when there is a son."""
+        deceased = Person("Deceased", Gender.MALE)
+        father = Person("Father", Gender.MALE)
+        grandfather = Person("Grandfather", Gender.MALE)
+        brother = Person("Brother", Gender.MALE)
+        nephew = Person("Nephew", Gender.MALE)
+        uncle = Person("Uncle", Gender.MALE)
+        cousin = Person("Cousin", Gender.MALE)
+
+        deceased.add_father(father)
+        father.add_father(grandfather)
+        brother.add_father(father)
+        brother.add_child(nephew)
+        uncle.add_father(grandfather)
+        uncle.add_child(cousin)
+
+        # Without a son, nobody is blocked
+        family_tree = FamilyTree(deceased, heirs_only=True)
+        self.assertEqual(family_tree.get_relatives(RelationshipType.NEPHEW), {nephew})
+        self.assertEqual(family_tree.get_relatives(RelationshipType.COUSIN), {cousin})
+
+        deceased.add_child(Person("Son", Gender.MALE))
+        family_tree = FamilyTree(deceased, heirs_only=True)
+        self.assertEqual(
+            family_tree.get_relatives(RelationshipType.BROTHER_PARENTAL), {brother}
+        )
+        self.assertEqual(
+            family_tree.get_relatives(RelationshipType.PARENTAL_UNCLE_PARENTAL),
+            {uncle},
+        )
+        self.assertEqual(family_tree.get_relatives(RelationshipType.NEPHEW), set())
+        self.assertEqual(family_tree.get_relatives(RelationshipType.COUSIN), set())
+
+        # The full tree is still built by default
+        family_tree = FamilyTree(deceased)
+        self.assertEqual(family_tree.get_relatives(RelationshipType.NEPHEW), {nephew})
+        self.assertEqual(family_tree.get_relatives(RelationshipType.COUSIN), {cousin})
+
+    def test_heirs_only_ignores_predeceased_son(self):
+        """Test that a son who died before the deceased blocks nobody."""
+        deceased = Person("Deceased", Gender.MALE, death_year=2020)
+        father = Person("Father", Gender.MALE)
+        brother = Person("Brother", Gender.MALE)
+        nephew = Person("Nephew", Gender.MALE)
+
+        deceased.add_father(father)
+        brother.add_father(father)
+        brother.add_child(nephew)
+        deceased.add_child(Person("Son", Gender.MALE, death_year=1990))
+
+        family_tree = FamilyTree(deceased, heirs_only=True)
+        self.assertEqual(family_tree.get_relatives(RelationshipType.NEPHEW), {nephew})
+
+        # A son who outlived the deceased still blocks the nephew
+        deceased.add_child(Person("Other Son", Gender.MALE, death_year=2021))
+        family_tree = FamilyTree(deceased, heirs_only=True)
+        self.assertEqual(family_tree.get_relatives(RelationshipType.NEPHEW), set())
+
     def test_process_descendants_with_no_children(self):
         """Test that a family tree with no descendants is correctly processed."""
         # Create a family with no descendants
@@ -273,6 +479,46 @@ class TestFamilyTree(unittest.TestCase):
             son.add_child(deceased)
             FamilyTree(deceased)
 
+    def test_get_relatives_by_type(self):
+        """Test that relatives are grouped by relationship type."""
+        relatives = self.family_tree.get_relatives_by_type()
+
+        self.assertEqual(relatives[RelationshipType.FATHER], {self.father})
+        self.assertEqual(relatives[RelationshipType.MOTHER], {self.mother})
+        self.assertEqual(
+            relatives[RelationshipType.GRANDFATHER],
+            {self.grandfather_paternal, self.grandfather_maternal},
+        )
+        self.assertNotIn(RelationshipType.SON, relatives)
+        self.assertIs(self.family_tree.get_relatives_by_type(), relatives)
+
+    def test_get_relationship(self):
+        """Test that a person's relationship to the deceased can be looked up."""
+        relationship = self.family_tree.get_relationship(self.grandfather_paternal)
+
+        self.assertEqual(relationship.relationship_type, RelationshipType.GRANDFATHER)
+        self.assertEqual(
+            relationship.lineage, (RelationshipType.FATHER, RelationshipType.FATHER)
+        )
+        self.assertIsNone(
+            self.family_tree.get_relationship(Person("Stranger", Gender.MALE))
+        )
+
+    def test_get_relatives_is_cached(self):
+        """Test that get_relatives returns the same frozen set on every call."""
+        fathers = self.family_tree.get_relatives(RelationshipType.FATHER)
+
+        self.assertIsInstance(fathers, frozenset)
+        self.assertIs(self.family_tree.get_relatives(RelationshipType.FATHER), fathers)
+        self.assertEqual(self.family_tree.get_relatives(RelationshipType.SON), set())
+
+    def test_visualize_is_cached(self):
+        """Test that the visualization is rendered once per language."""
+        visualization = self.family_tree.visualize()
+
+        self.assertIn(self.father.name, visualization)
+        self.assertIs(self.family_tree.visualize(), visualization)
+
     def test_change_focal_point(self):
         deceased = Person("Deceased", Gender.MALE)
         son = (
@@ -301,6 +547,33 @@ class TestFamilyTree(unittest.TestCase):
         # When / Then
         family_tree = FamilyTree(deceased)
         self.assertEqual(family_tree.get_all_deceased(), {deceased, son})
+        self.assertIs(family_tree.get_all_deceased(), family_tree.get_all_deceased())
+
+    def test_get_all_members(self):
+        deceased = Person("Deceased", Gender.MALE)
+        son = Person("Son", Gender.MALE)
+        wife = Person("Wife", Gender.FEMALE)
+        deceased.add_child(son)
+        deceased.add_spouse(wife)
+        # When / Then
+        family_tree = FamilyTree(deceased)
+        members = family_tree.get_all_members()
+        self.assertEqual(members, {deceased, son, wife})
+        self.assertIs(family_tree.get_all_members(), members)
+
+    def test_get_all_members_is_a_snapshot(self):
+        deceased = Person("Deceased", Gender.MALE)
+        family_tree = FamilyTree(deceased)
+        members = family_tree.get_all_members()
+        deceased_members = family_tree.get_all_deceased()
+        # When
+        son = Person("Son", Gender.MALE, death_year=2010)
+        deceased.add_child(son)
+        # Then
+        self.assertEqual(family_tree.get_all_members(), {deceased})
+        self.assertIs(family_tree.get_all_members(), members)
+        self.assertIs(family_tree.get_all_deceased(), deceased_members)
+        self.assertEqual(FamilyTree(deceased).get_all_members(), {deceased, son})
 
 
 if __name__ == "__main__":
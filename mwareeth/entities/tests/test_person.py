@@ -77,6 +77,17 @@ class TestPerson(unittest.TestCase):
         dead_person = Person("Dead", Gender.MALE, death_year=2020)
         self.assertFalse(dead_person.is_alive)
 
+    def test_fullname_property(self):
+        """Test that fullname lists the paternal line from the oldest ancestor."""
+        person = Person("Child", Gender.MALE)
+        self.assertEqual(person.fullname, "child")
+
+        father = Person("Father", Gender.MALE)
+        person.add_father(father)
+        father.add_father(Person("Grandfather", Gender.MALE))
+        person.add_mother(Person("Mother", Gender.FEMALE))
+        self.assertEqual(person.fullname, "grandfather>father>child")
+
     def test_add_father(self):
         """Test the add_father method."""
         # Test adding a father
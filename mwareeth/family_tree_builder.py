@@ -5,7 +5,7 @@ from their inputs in an interactive and user-friendly way.
 
 import importlib.util
 from enum import IntEnum, auto
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .entities.family_tree import FamilyTree
 from .entities.person import Gender, Person, Religion
@@ -13,6 +13,12 @@ from .i18n import _, force_language, get_available_languages, set_language
 
 GRAPHVIZ_AVAILABLE = importlib.util.find_spec("graphviz") is not None
 
+# Case-insensitive lookup of user inputs, resolved with a single dict lookup
+_GENDERS_BY_NAME: Dict[str, Gender] = {gender.name.lower(): gender for gender in Gender}
+_RELIGIONS_BY_NAME: Dict[str, Religion] = {
+    religion.name.lower(): religion for religion in Religion
+}
+
 
 class InteractiveBuildCommand(IntEnum):
     ADD_PERSON = auto()
@@ -87,25 +93,10 @@ class FamilyTreeBuilder:
                 _("A person with the name '{name}' already exists", name=name)
             )
 
-        # Convert gender string to Gender enum
-        try:
-            gender_enum = Gender[gender.upper()]
-        except KeyError:
-            raise ValueError(
-                _("Invalid gender: {gender}. Must be 'male' or 'female'", gender=gender)
-            )
-
-        # Convert religion string to Religion enum
-        try:
-            religion_enum = Religion[religion.upper()]
-        except KeyError:
-            religion_enum = Religion.OTHER
-
-        # Create the person
-        person = Person(
+        person = self._create_person(
             name=name,
-            gender=gender_enum,
-            religion=religion_enum,
+            gender=gender,
+            religion=religion,
             birth_year=birth_year,
             death_year=death_year,
         )
@@ -121,6 +112,83 @@ class FamilyTreeBuilder:
 
         return person
 
+    def add_people(self, records: List[Dict]) -> List[Person]:
+        """
+        Add several people to the family tree at once.
+
+        All records are validated before any person is added, so the family tree is
+        left unchanged if one of them is invalid.
+
+        Args:
+            records: A list of dictionaries accepting the same keys as `add_person`
+                ("name", "gender", and optionally "religion", "birth_year",
+                "death_year" and "is_deceased")
+
+        Returns:
+            The created Person objects, in the same order as the records
+
+        Raises:
+            ValueError: If a name is duplicated, if invalid data is provided or if more
+                than one deceased person would be set
+        """
+        people: Dict[str, Person] = {}
+        deceased = self.deceased
+        for record in records:
+            name = record["name"]
+            if name in self.people or name in people:
+                raise ValueError(
+                    _("A person with the name '{name}' already exists", name=name)
+                )
+
+            person = self._create_person(
+                name=name,
+                gender=record["gender"],
+                religion=record.get("religion", "Islam"),
+                birth_year=record.get("birth_year"),
+                death_year=record.get("death_year"),
+            )
+            if record.get("is_deceased", False):
+                if deceased:
+                    raise ValueError(_("A deceased person is already set"))
+                deceased = person
+            people[name] = person
+
+        self.people.update(people)
+        self.deceased = deceased
+        return list(people.values())
+
+    def _create_person(
+        self,
+        name: str,
+        gender: str,
+        religion: str = "Islam",
+        birth_year: Optional[int] = None,
+        death_year: Optional[int] = None,
+    ) -> Person:
+        """
+        Create a person from user inputs without adding them to the family tree.
+
+        Raises:
+            ValueError: If invalid data is provided
+        """
+        # Convert gender string to Gender enum
+        gender_enum = _GENDERS_BY_NAME.get(gender.lower())
+        if gender_enum is None:
+            raise ValueError(
+                _("Invalid gender: {gender}. Must be 'male' or 'female'", gender=gender)
+            )
+
+        # Convert religion string to Religion enum
+        religion_enum = _RELIGIONS_BY_NAME.get(religion.lower(), Religion.OTHER)
+
+        return Person(
+            name=name,
+            gender=gender_enum,
+            religion=religion_enum,
+            birth_year=birth_year,
+            death_year=death_year,
+        )
+
     def set_deceased(self, name: str) -> Person:
         """
         Set a person as the deceased (focal point of the tree).
@@ -183,6 +251,58 @@ class FamilyTreeBuilder:
 
         return person, relative
 
+    def add_relationships(
+        self, relationships: List[Tuple[str, str, str]]
+    ) -> List[Tuple[Person, Person]]:
+        """
+        Add several relationships at once.
+
+        Like `add_people`, this is atomic: if one of the relationships is invalid, the
+        ones already linked are undone, so the family tree is left unchanged.
+
+        Args:
+            relationships: A list of (person_name, relation_type, relative_name) tuples,
+                as accepted by `add_relationship`
+
+        Returns:
+            A list of (person, relative) Person objects, one per relationship
+
+        Raises:
+            ValueError: If either person does not exist or if a relationship is invalid
+        """
+        # Only the people named in the relationships can be linked, so saving their
+        # links is enough to restore the family tree on failure
+        involved = {
+            self.people[name]
+            for person_name, _relation_type, relative_name in relationships
+            for name in (person_name, relative_name)
+            if name in self.people
+        }
+        links = [
+            (
+                person,
+                person.father,
+                person.mother,
+                set(person.children),
+                set(person.spouses),
+            )
+            for person in involved
+        ]
+        try:
+            return [
+                self.add_relationship(person_name, relation_type, relative_name)
+                for person_name, relation_type, relative_name in relationships
+            ]
+        except ValueError:
+            # Linking only ever adds to the children and spouses, so restoring them
+            # means dropping whatever was not there before
+            for person, father, mother, children, spouses in links:
+                person.father = father
+                person.mother = mother
+                person.children.intersection_update(children)
+                person.spouses.intersection_update(spouses)
+            raise
+
     def add_father(self, child_name: str, father_name: str) -> Tuple[Person, Person]:
         """
         Add a father-child relationship.
@@ -249,15 +369,10 @@ class FamilyTreeBuilder:
             errors.append(_("No deceased person is set"))
 
         # Check for circular references
-        visited = set()
-        for person in self.people.values():
-            path = set()
-            if self._has_circular_reference(person, visited, path):
-                errors.append(
-                    _("Circular reference detected involving {name}", name=person.name)
-                )
-                errors.append(f"  - Visited: {', '.join(p.name for p in visited)}")
-                errors.append(f"  - Path: {', '.join(p.name for p in path)}")
+        for person in self._find_circular_references():
+            errors.append(
+                _("Circular reference detected involving {name}", name=person.name)
+            )
 
         # Check for inconsistent relationships
         for name, person in self.people.items():
@@ -286,48 +401,72 @@ class FamilyTreeBuilder:
 
         return errors
 
-    def _has_circular_reference(
-        self, person: Person, visited: Set[Person], path: Set[Person]
-    ) -> bool:
+    def _find_circular_references(self) -> List[Person]:
         """
-        Check if there's a circular reference in the family tree.
+        Find the people involved in a circular reference in the family tree.
 
-        Args:
-            person: The person to check
-            visited: Set of already visited person IDs
-            path: Set of person IDs in the current path
+        The parent-child links must form a directed acyclic graph. A person is on a
+        cycle exactly when they share a strongly connected component with someone
+        else, or are their own child. The components are found with an iterative
+        version of Tarjan's algorithm, which visits every person and link once.
 
         Returns:
-            True if a circular reference is detected, False otherwise
-        """
-        person_id = person
-
-        # If we've seen this person in the current path, there's a cycle
-        if person_id in path:
-            return True
-
-        # If we've already checked this person and found no cycles, skip
-        if person_id in visited:
-            return False
-
-        # # Check parents
-        # if person.father and self._has_circular_reference(person.father, visited, path):
-        #     return True
-        # if person.mother and self._has_circular_reference(person.mother, visited, path):
-        #     return True
-
-        # Add the person to the current path
-        path.add(person_id)
-
-        # Check children
-        for child in person.children:
-            if self._has_circular_reference(child, visited, path):
-                return True
-
-        # No cycles found, remove from path and mark as visited
-        path.remove(person_id)
-        visited.add(person_id)
-        return False
+            The people on a circular reference, in the order they were added
+        """
+        # Index at which each person was discovered, and the lowest index reachable
+        # from them through the people still on the stack
+        index: Dict[Person, int] = {}
+        lowlink: Dict[Person, int] = {}
+        stack: List[Person] = []
+        on_stack = set()
+        on_cycle = set()
+
+        for root in self.people.values():
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            # Depth-first walk over the children, without recursion
+            work = [(root, iter(root.children))]
+            while work:
+                person, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(child.children)))
+                    elif child in on_stack:
+                        lowlink[person] = min(lowlink[person], index[child])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[person])
+                if lowlink[person] != index[person]:
+                    continue
+
+                # The person is the root of a component: pop all of its members
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member is person:
+                        break
+                if len(component) > 1 or person in person.children:
+                    on_cycle.update(component)
+
+        # Report the known people in the order they were added, then anyone else
+        # reached through their children
+        return [person for person in self.people.values() if person in on_cycle] + [
+            person
+            for person in index
+            if person in on_cycle and self.people.get(person.name) is not person
+        ]
 
     def build(self) -> FamilyTree:
         """
@@ -378,23 +517,27 @@ class FamilyTreeBuilder:
             }
         """
         # Add people
-        for person_data in data.get("people", []):
-            self.add_person(
-                name=person_data["name"],
-                gender=person_data["gender"],
-                religion=person_data.get("religion", "Islam"),
-                birth_year=person_data.get("birth_year"),
-                death_year=person_data.get("death_year"),
-                is_deceased=person_data["name"] == data.get("deceased"),
-            )
+        self.add_people(
+            [
+                {
+                    "name": person_data["name"],
+                    "gender": person_data["gender"],
+                    "religion": person_data.get("religion", "Islam"),
+                    "birth_year": person_data.get("birth_year"),
+                    "death_year": person_data.get("death_year"),
+                    "is_deceased": person_data["name"] == data.get("deceased"),
+                }
+                for person_data in data.get("people", [])
+            ]
+        )
 
         # Add relationships
-        for rel_data in data.get("relationships", []):
-            self.add_relationship(
-                person_name=rel_data["person"],
-                relation_type=rel_data["relation"],
-                relative_name=rel_data["relative"],
-            )
+        self.add_relationships(
+            [
+                (rel_data["person"], rel_data["relation"], rel_data["relative"])
+                for rel_data in data.get("relationships", [])
+            ]
+        )
 
         return self
 
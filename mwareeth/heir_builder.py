@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional, Sequence
 
 from statemachine import StateMachine
 from statemachine.states import States
@@ -129,12 +129,12 @@ class HeirStateMachine(StateMachine):
         return HeirType.__members__[self.current_state.name.upper().replace(" ", "_")]
 
 
-def deduce_heir_type(lineage: List[RelationshipType]) -> HeirType:
+def deduce_heir_type(lineage: Sequence[RelationshipType]) -> HeirType:
     """
     Deduce the heir type from a lineage of relationships.
 
     Args:
-        lineage: A list of relationship types representing the path from the deceased to the heir
+        lineage: A sequence of relationship types representing the path from the deceased to the heir
 
     Returns:
         The deduced heir type
@@ -4,10 +4,11 @@ using the standard gettext library.
 """
 
 import contextlib
+import functools
 import gettext as _gettext
 import os
 import warnings
-from typing import Dict, List
+from typing import List
 
 # Set up the gettext translation system
 PROJECT_NAME = "mwareeth"
@@ -17,38 +18,35 @@ SUPPORTED_LANGUAGES = ["en", "ar"]
 # Default to English if no translation is found
 FALLBACK_LANGUAGE = "en"
 
-# Store translations for different languages
-_translations: Dict[str, _gettext.NullTranslations] = {}
 _current_language = "en"
 
 
+@functools.lru_cache(maxsize=16)
 def _get_translation(language: str) -> _gettext.NullTranslations:
     """
     Get the translation object for the specified language.
 
+    The catalog is parsed once per language and reused by every later call.
+
     Args:
         language: The language code to get the translation for
 
     Returns:
         A gettext translation object
     """
-    if language not in _translations:
-        try:
-            _translations[language] = _gettext.translation(
-                PROJECT_NAME,
-                localedir=LOCALE_DIR,
-                languages=[language],
-                fallback=True,
-            )
-        except FileNotFoundError:
-            warnings.warn(
-                f"Translation file for language '{language}' not found. Using fallback language '{FALLBACK_LANGUAGE}'."
-            )
-            # If the translation file is not found, use a NullTranslations object
-            _translations[language] = _gettext.NullTranslations()
-
-    _translations[language].install()
-    return _translations[language]
+    try:
+        return _gettext.translation(
+            PROJECT_NAME,
+            localedir=LOCALE_DIR,
+            languages=[language],
+            fallback=True,
+        )
+    except FileNotFoundError:
+        warnings.warn(
+            f"Translation file for language '{language}' not found. Using fallback language '{FALLBACK_LANGUAGE}'."
+        )
+        # If the translation file is not found, use a NullTranslations object
+        return _gettext.NullTranslations()
 
 
 def set_language(language: str) -> None:
@@ -64,6 +62,17 @@ def set_language(language: str) -> None:
         language = FALLBACK_LANGUAGE
 
     _current_language = language
+    _get_translation(language).install()
+
+
+def get_language() -> str:
+    """
+    Get the current language for translations.
+
+    Returns:
+        The language code currently in use
+    """
+    return _current_language
 
 
 def get_available_languages() -> List[str]:
@@ -0,0 +1,167 @@
+"""
+Unit tests for the family_tree_builder module.
+"""
+
+import unittest
+
+from ..entities.person import Gender
+from ..family_tree_builder import FamilyTreeBuilder
+
+
+class TestFamilyTreeBuilder(unittest.TestCase):
+    """Tests for the FamilyTreeBuilder class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.builder = FamilyTreeBuilder(language="en")
+
+    def test_add_people(self):
+        """Test that add_people adds every record and sets the deceased."""
+        people = self.builder.add_people(
+            [
+                {"name": "John", "gender": "male", "is_deceased": True},
+                {"name": "Mary", "gender": "female", "birth_year": 1952},
+            ]
+        )
+
+        self.assertEqual([person.name for person in people], ["John", "Mary"])
+        self.assertEqual(self.builder.people["Mary"].gender, Gender.FEMALE)
+        self.assertEqual(self.builder.people["Mary"].birth_year, 1952)
+        self.assertIs(self.builder.deceased, self.builder.people["John"])
+
+    def test_add_people_is_atomic(self):
+        """Test that add_people adds nobody when one record is invalid."""
+        with self.assertRaises(ValueError):
+            self.builder.add_people(
+                [
+                    {"name": "John", "gender": "male"},
+                    {"name": "John", "gender": "male"},
+                ]
+            )
+        with self.assertRaises(ValueError):
+            self.builder.add_people(
+                [
+                    {"name": "John", "gender": "male"},
+                    {"name": "Mary", "gender": "invalid"},
+                ]
+            )
+
+        self.assertEqual(self.builder.people, {})
+        self.assertIsNone(self.builder.deceased)
+
+    def test_add_relationships(self):
+        """Test that add_relationships links every pair of people."""
+        self.builder.add_people(
+            [
+                {"name": "John", "gender": "male", "is_deceased": True},
+                {"name": "Mary", "gender": "female"},
+                {"name": "Bob", "gender": "male"},
+            ]
+        )
+
+        self.builder.add_relationships(
+            [
+                ("Bob", "father", "John"),
+                ("Bob", "mother", "Mary"),
+            ]
+        )
+
+        bob = self.builder.people["Bob"]
+        self.assertIs(bob.father, self.builder.people["John"])
+        self.assertIs(bob.mother, self.builder.people["Mary"])
+
+    def test_add_relationships_is_atomic(self):
+        """Test that add_relationships links nobody when one relationship is invalid."""
+        self.builder.add_people(
+            [
+                {"name": "John", "gender": "male", "is_deceased": True},
+                {"name": "Mary", "gender": "female"},
+                {"name": "Bob", "gender": "male"},
+                {"name": "Sam", "gender": "male"},
+            ]
+        )
+
+        with self.assertRaises(ValueError):
+            self.builder.add_relationships(
+                [
+                    ("Bob", "father", "John"),
+                    ("John", "spouse", "Mary"),
+                    ("Bob", "father", "Sam"),
+                ]
+            )
+        with self.assertRaises(ValueError):
+            self.builder.add_relationships(
+                [
+                    ("Bob", "mother", "Mary"),
+                    ("Bob", "father", "Unknown"),
+                ]
+            )
+
+        for person in self.builder.people.values():
+            self.assertIsNone(person.father)
+            self.assertIsNone(person.mother)
+            self.assertEqual(person.children, set())
+            self.assertEqual(person.spouses, set())
+
+    def test_validate_reports_circular_references(self):
+        """Test that validate reports exactly the people on a circular reference."""
+        self.builder.add_people(
+            [
+                {"name": "Mary", "gender": "female"},
+                {"name": "John", "gender": "male", "is_deceased": True},
+                {"name": "Bob", "gender": "male"},
+                {"name": "Sam", "gender": "male"},
+                {"name": "Ali", "gender": "male"},
+            ]
+        )
+        self.builder.add_relationships(
+            [
+                ("John", "mother", "Mary"),
+                ("Bob", "father", "John"),
+                ("Sam", "father", "Bob"),
+                ("Ali", "father", "Sam"),
+            ]
+        )
+        self.assertEqual(self.builder.validate(), [])
+
+        self.builder.people["Sam"].add_child(self.builder.people["John"])
+
+        self.assertEqual(
+            self.builder.validate(),
+            [
+                f"Circular reference detected involving {name}"
+                for name in ("John", "Bob", "Sam")
+            ],
+        )
+
+    def test_validate_skips_people_between_two_cycles(self):
+        """Test that a person linking two circular references is not reported."""
+        self.builder.add_people(
+            [
+                {"name": "A", "gender": "male", "is_deceased": True},
+                {"name": "B", "gender": "male"},
+                {"name": "C", "gender": "male"},
+                {"name": "D", "gender": "male"},
+                {"name": "G", "gender": "female"},
+            ]
+        )
+        people = self.builder.people
+        # A <-> B -> C -> D <-> G
+        people["A"].add_child(people["B"])
+        people["B"].add_child(people["A"])
+        people["B"].add_child(people["C"])
+        people["C"].add_child(people["D"])
+        people["D"].add_child(people["G"])
+        people["G"].add_child(people["D"])
+
+        self.assertEqual(
+            self.builder.validate(),
+            [
+                f"Circular reference detected involving {name}"
+                for name in ("A", "B", "D", "G")
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,9 @@
 import unittest
 
 from ..entities.heir import HeirType
-from ..entities.relationship import RelationshipType
-from ..heir_builder import deduce_heir_type
+from ..entities.person import Gender, Person
+from ..entities.relationship import Relationship, RelationshipType
+from ..heir_builder import create_heir_from_relationship, deduce_heir_type
 
 
 class TestHeirBuilder(unittest.TestCase):
@@ -252,6 +253,23 @@ class TestHeirBuilder(unittest.TestCase):
         ]
         self.assertEqual(deduce_heir_type(lineage), HeirType.UTERINE)
 
+    def test_heir_share_types(self):
+        father = create_heir_from_relationship(
+            Relationship.father(Person("Father", Gender.MALE))
+        )
+        self.assertTrue(father.is_fardh)
+        self.assertTrue(father.is_taasib)
+
+        son = create_heir_from_relationship(
+            Relationship(
+                Person("Son", Gender.MALE),
+                RelationshipType.SON,
+                (RelationshipType.SON,),
+            )
+        )
+        self.assertFalse(son.is_fardh)
+        self.assertTrue(son.is_taasib)
+
 
 if __name__ == "__main__":
     unittest.main()
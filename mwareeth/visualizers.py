@@ -56,6 +56,8 @@ class FamilyTreeTextVisualizer(FamilyTreeVisualizer):
             A string representation of the family tree, where each line represents a relationship.
         """
         lines = []
+        # Group the relatives by relationship type once for all sections
+        relatives = self.family_tree.get_relatives_by_type()
 
         # Add the deceased person as the root
         lines.append(
@@ -67,25 +69,25 @@ class FamilyTreeTextVisualizer(FamilyTreeVisualizer):
         lines.append(f"=== {_('Ancestors')} ===")
 
         # Parents
-        father = self.family_tree.get_relatives(RelationshipType.FATHER)
+        father = relatives.get(RelationshipType.FATHER, ())
         if father:
-            father_person = list(father)[0]
+            father_person = next(iter(father))
             lines.append(f"{_('father').capitalize()}: {father_person.name}")
 
-        mother = self.family_tree.get_relatives(RelationshipType.MOTHER)
+        mother = relatives.get(RelationshipType.MOTHER, ())
         if mother:
-            mother_person = list(mother)[0]
+            mother_person = next(iter(mother))
             lines.append(f"{_('mother').capitalize()}: {mother_person.name}")
 
         # Grandparents
-        grandfathers = self.family_tree.get_relatives(RelationshipType.GRANDFATHER)
+        grandfathers = relatives.get(RelationshipType.GRANDFATHER, ())
         if grandfathers:
             lines.append(f"{_('Grandfathers')}:")
             for grandfather in grandfathers:
                 # Determine if paternal or maternal
                 lines.append(f"  - {grandfather.name}")
 
-        grandmothers = self.family_tree.get_relatives(RelationshipType.GRANDMOTHER)
+        grandmothers = relatives.get(RelationshipType.GRANDMOTHER, ())
         if grandmothers:
             lines.append(f"{_('Grandmothers')}:")
             for grandmother in grandmothers:
@@ -95,8 +97,8 @@ class FamilyTreeTextVisualizer(FamilyTreeVisualizer):
         lines.append("")
 
         # Add siblings
-        brothers, sisters = partition(
-            lambda x: x.is_female, self.family_tree.get_siblings()
+        brothers, sisters = map(
+            list, partition(lambda x: x.is_female, self.family_tree.get_siblings())
         )
 
         if brothers or sisters:
@@ -115,10 +117,11 @@ class FamilyTreeTextVisualizer(FamilyTreeVisualizer):
             lines.append("")
 
         # Add extended family
-        uncles, aunts = partition(
-            lambda x: x.is_female, self.family_tree.get_uncles_and_aunts()
+        uncles, aunts = map(
+            list,
+            partition(lambda x: x.is_female, self.family_tree.get_uncles_and_aunts()),
         )
-        cousins = self.family_tree.get_relatives(RelationshipType.COUSIN)
+        cousins = relatives.get(RelationshipType.COUSIN, ())
 
         if uncles or aunts or cousins:
             lines.append(f"=== {_('Extended Family')} ===")
@@ -141,24 +144,29 @@ class FamilyTreeTextVisualizer(FamilyTreeVisualizer):
             lines.append("")
 
         # Add descendants
-        sons = self.family_tree.get_relatives(RelationshipType.SON)
-        daughters = self.family_tree.get_relatives(RelationshipType.DAUGHTER)
+        sons = relatives.get(RelationshipType.SON, ())
+        daughters = relatives.get(RelationshipType.DAUGHTER, ())
 
         if sons or daughters:
             lines.append(f"=== {_('Descendants')} ===")
 
+            # Translate the labels repeated for every grandchild only once
+            grandchildren_label = _("Grandchildren")
+            son_label = _("Son")
+            daughter_label = _("Daughter")
+
             if sons:
                 lines.append(f"{_('Sons')}:")
                 for son in sons:
                     lines.append(f"  - {son.name}")
                     # Add grandchildren
                     if son.children:
-                        lines.append(f"    {_('Grandchildren')}:")
+                        lines.append(f"    {grandchildren_label}:")
                         for grandchild in son.children:
                             gender = (
-                                _("Son")
+                                son_label
                                 if grandchild.gender == Gender.MALE
-                                else _("Daughter")
+                                else daughter_label
                             )
                             lines.append(f"      - {grandchild.name} ({gender})")
 
@@ -168,12 +176,12 @@ class FamilyTreeTextVisualizer(FamilyTreeVisualizer):
                     lines.append(f"  - {daughter.name}")
                     # Add grandchildren
                     if daughter.children:
-                        lines.append(f"    {_('Grandchildren')}:")
+                        lines.append(f"    {grandchildren_label}:")
                         for grandchild in daughter.children:
                             gender = (
-                                _("Son")
+                                son_label
                                 if grandchild.gender == Gender.MALE
-                                else _("Daughter")
+                                else daughter_label
                             )
                             lines.append(f"      - {grandchild.name} ({gender})")
 